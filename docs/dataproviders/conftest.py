@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import hashlib
+
+import pytest
+from filelock import FileLock
+from lxml import etree
+
+from osc_validation.dataproviders import (
+    BuiltinDataProvider,
+    DownloadDataProvider,
+    DownloadZIPDataProvider,
+)
+from osc_validation.pytest_plugin import use_loadfile_distribution_by_default
+
+# Remote resources used by the demo modules, keyed by their cache directory name
+REMOTE_RESOURCES = {
+    "download": (
+        DownloadDataProvider,
+        "https://github.com/lichtblick-suite/asam-osi-converter/raw/refs/heads/main/example-data/disappearingVehicle.mcap",
+    ),
+    "download-zip": (
+        DownloadZIPDataProvider,
+        "https://github.com/thomassedlmayer/example-files-zip/raw/refs/heads/main/example-mcaps.zip",
+    ),
+}
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_cmdline_main(config):
+    # Each demo module shares its downloads and tool runs between its tests.
+    use_loadfile_distribution_by_default(config)
+    return (yield)
+
+
+@pytest.fixture(scope="session")
+def download_cache_path(pytestconfig, tmp_path_factory) -> Path:
+    """
+    Download directory in pytest's cache directory (.pytest_cache).
+
+    It is shared by all pytest-xdist workers and kept across sessions, so
+    remote resources are only fetched again if they changed on the server.
+    It is removed by ``pytest --cache-clear``.
+
+    If the cache provider is disabled (``-p no:cacheprovider``), the common
+    parent of the workers' base temp directories is used instead. It is only
+    kept as long as pytest's temp directory rotation keeps it.
+    """
+    if getattr(pytestconfig, "cache", None) is not None:
+        return pytestconfig.cache.mkdir("download-cache")
+    path = tmp_path_factory.getbasetemp().parent / "download-cache"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@pytest.fixture(scope="session")
+def builtin_data_provider(builtin_data_path) -> BuiltinDataProvider:
+    return BuiltinDataProvider(builtin_data_path)
+
+
+@pytest.fixture(
+    scope="session",
+    params=["xodr_example/map.xodr"],
+)
+def odr_file(request, builtin_data_provider) -> Path:
+    """
+    Resolves the builtin OpenDRIVE file once per session for all demo modules.
+    """
+    return builtin_data_provider.ensure_data_path(request.param)
+
+
+def _load_locked(provider_cls, uri: str, base_path: Path):
+    # The lock makes parallel pytest-xdist workers wait for the first download
+    # instead of fetching the same resource again. The provider is created
+    # while holding the lock so that it sees the files of that download.
+    with FileLock(f"{base_path}.lock"):
+        provider = provider_cls(uri=uri, base_path=base_path)
+        provider.ensure_loaded()
+    return provider
+
+
+@pytest.fixture(scope="session")
+def remote_providers(download_cache_path):
+    """
+    Downloads or revalidates all REMOTE_RESOURCES concurrently, once per
+    session, and returns the loaded data providers by name.
+    """
+    with ThreadPoolExecutor(max_workers=len(REMOTE_RESOURCES)) as executor:
+        futures = {
+            name: executor.submit(
+                _load_locked, provider_cls, uri, download_cache_path / name
+            )
+            for name, (provider_cls, uri) in REMOTE_RESOURCES.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _file_digest(path: Path) -> str:
+    return hashlib.md5(Path(path).read_bytes(), usedforsecurity=False).hexdigest()
+
+
+def _scenario_digest(osc_path: Path) -> str:
+    # osi2osc stamps the generation time into the FileHeader, which would make
+    # otherwise identical scenarios differ.
+    tree = etree.parse(str(osc_path))
+    for file_header in tree.iter("FileHeader"):
+        file_header.attrib.pop("date", None)
+    return hashlib.md5(etree.tostring(tree), usedforsecurity=False).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def generate_tool_trace(generate_tool_trace):
+    """
+    Wraps the generate_tool_trace fixture of the plugin so that the tool runs
+    only once per scenario, road network and rate.
+
+    The generated trace does not depend on the moving object under test, so the
+    parametrized demo tests share the output of the first tool run.
+    """
+    tool_traces = {}
+
+    def generate(osc_path, odr_path, osi_output_spec, log_path=None, rate=0.05):
+        key = (
+            _scenario_digest(osc_path),
+            _file_digest(odr_path),
+            rate,
+            osi_output_spec.message_type,
+            osi_output_spec.path.suffix,
+        )
+        if key not in tool_traces:
+            tool_traces[key] = generate_tool_trace(
+                osc_path=osc_path,
+                odr_path=odr_path,
+                osi_output_spec=osi_output_spec,
+                log_path=log_path,
+                rate=rate,
+            )
+        return tool_traces[key]
+
+    return generate
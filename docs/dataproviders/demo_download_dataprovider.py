@@ -1,39 +1,18 @@
 import logging
 from pathlib import Path
 from typing import Callable
-from urllib.parse import urlparse
 
 import pytest
 
-from osc_validation.dataproviders import BuiltinDataProvider, DownloadDataProvider
 from osc_validation.generation import osi2osc
 from osc_validation.metrics.trajectory_similarity import TrajectorySimilarityMetric
 from osi_utilities import ChannelSpecification
 
 
-@pytest.fixture(
-    scope="module",
-    params=[
-        "https://github.com/lichtblick-suite/asam-osi-converter/raw/refs/heads/main/example-data/disappearingVehicle.mcap"
-    ],
-)
-def osi_trace(request):
-    uri = request.param
-    filename = Path(urlparse(uri).path).name
-    base_path = Path("download")
-    provider = DownloadDataProvider(uri=uri, base_path=base_path)
-    yield provider.ensure_data_path(filename)
-    provider.cleanup()
-
-
-@pytest.fixture(
-    scope="module",
-    params=["xodr_example/map.xodr"],
-)
-def odr_file(request, builtin_data_path):
-    provider = BuiltinDataProvider(builtin_data_path)
-    yield provider.ensure_data_path(request.param)
-    provider.cleanup()
+@pytest.fixture(scope="session")
+def osi_trace(remote_providers):
+    provider = remote_providers["download"]
+    return provider.ensure_data_path(provider.filename)
 
 
 @pytest.mark.parametrize("moving_object_id", [1])
@@ -51,7 +30,7 @@ def test_trajectory_remote(
 
     Args:
         osi_trace (Path): Path to the original OSI trace file (pytest module fixture).
-        odr_file (Path): Path to the OpenDRIVE (.odr) file (pytest module fixture).
+        odr_file (Path): Path to the OpenDRIVE (.odr) file (pytest session fixture).
         yaml_ruleset (Path): Path to the YAML ruleset for OSITrace quality checks (pytest module fixture).
         generate_tool_trace (Callable): Function to generate an OSI trace from an OpenSCENARIO file (pytest session fixture).
         tmp_path (Path): Temporary directory for intermediate files (built-in pytest fixture).
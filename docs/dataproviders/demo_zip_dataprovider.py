@@ -1,18 +1,16 @@
+from functools import lru_cache
 import logging
 from pathlib import Path
 from typing import Callable
 
 import pytest
 
-from osc_validation.dataproviders import BuiltinDataProvider, DownloadZIPDataProvider
 from osc_validation.generation import osi2osc
 from osc_validation.metrics.trajectory_similarity import TrajectorySimilarityMetric
 from osi_utilities import ChannelSpecification
 from osc_validation.utils.utils import get_all_moving_object_ids
 
 
-ZIP_URI = "https://github.com/thomassedlmayer/example-files-zip/raw/refs/heads/main/example-mcaps.zip"
-
 # Map each file to the object IDs to be tested
 ZIP_CONTENTS_TO_IDS = {
     # "nurbs_road.mcap": [14],
@@ -21,17 +19,24 @@ ZIP_CONTENTS_TO_IDS = {
 }
 
 
-@pytest.fixture(scope="module")
-def zip_provider():
+@lru_cache(maxsize=32)
+def _moving_object_ids(osi_trace: Path) -> tuple[int, ...]:
+    # Scanning a trace walks all of its frames; the extracted files do not
+    # change during a session, so each file is scanned once for all object IDs.
+    return tuple(
+        get_all_moving_object_ids(
+            ChannelSpecification(osi_trace, message_type="SensorView")
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def zip_provider(remote_providers):
     """
-    Downloads and extracts the ZIP once per module, then yields the zip data provider.
+    Yields the zip data provider whose archive was downloaded and extracted
+    once per session by the remote_providers fixture.
     """
-    base_path = Path("download-zip")
-    provider = DownloadZIPDataProvider(uri=ZIP_URI, base_path=base_path)
-
-    provider.download()
-    yield provider
-    provider.cleanup()
+    yield remote_providers["download-zip"]
 
 
 @pytest.fixture(
@@ -53,16 +58,6 @@ def osi_trace_with_ids(request, zip_provider):
     yield mcap_path, obj_id
 
 
-@pytest.fixture(
-    scope="module",
-    params=["xodr_example/map.xodr"],
-)
-def odr_file(request, builtin_data_path):
-    provider = BuiltinDataProvider(builtin_data_path)
-    yield provider.ensure_data_path(request.param)
-    provider.cleanup()
-
-
 def test_trajectory_remote_zip(
     osi_trace_with_ids: Path,
     odr_file: Path,
@@ -97,7 +92,7 @@ def test_trajectory_remote_zip(
         osi_trace, message_type="SensorView"
     )
 
-    object_ids = get_all_moving_object_ids(reference_trace_channel_spec)
+    object_ids = _moving_object_ids(osi_trace)
     if moving_object_id not in object_ids:
         pytest.skip(
             f"Object ID {moving_object_id} not found in {osi_trace.name}. Available ids: {str(object_ids)}"
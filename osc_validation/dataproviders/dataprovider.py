@@ -1,11 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-import io
+import os
 import requests
 import zipfile
 import shutil
 
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Resources of at least this size are fetched with parallel range requests if
+# the server supports them; a single connection cannot saturate links with a
+# high bandwidth-delay product.
+_PARALLEL_DOWNLOAD_MIN_SIZE = 16 << 20
+_PARALLEL_DOWNLOAD_CONNECTIONS = 4
+
+# Shared by all download providers so that connections (and TLS handshakes)
+# are reused across the provider fixtures of a test session.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Resources already downloaded or revalidated in this process, keyed by
+# (uri, resolved base path), so that providers re-created for every fixture
+# parameter do not fetch the same resource again.
+_DOWNLOAD_CACHE: set[tuple[str, Path]] = set()
+
+
+@lru_cache(maxsize=None)
+def _uri_filename(uri: str) -> str:
+    # Providers are re-created for every fixture parameter, so the parsed
+    # filename is cached per URI. Does not support indirect URIs.
+    return Path(urlparse(uri).path).name
+
+
+def _cache_validators(headers) -> str:
+    return f"{headers.get('ETag', '')}\n{headers.get('Last-Modified', '')}"
+
+
+def _preallocate(file, headers):
+    """
+    Reserves disk space for the announced download size so the filesystem can
+    allocate contiguous extents up front. Only supported on POSIX systems; the
+    caller truncates the file to the actually written size afterwards.
+    """
+    if not hasattr(os, "posix_fallocate"):
+        return
+    if headers.get("Content-Encoding", "identity") != "identity":
+        # The decoded body size differs from the announced length.
+        return
+    try:
+        size = int(headers.get("Content-Length", 0))
+        if size > 0:
+            os.posix_fallocate(file.fileno(), 0, size)
+    except (ValueError, OSError):
+        pass
+
+
+def _parallel_download_size(headers) -> int:
+    """
+    Returns the resource size if it should be fetched with parallel range
+    requests, otherwise 0.
+    """
+    if headers.get("Accept-Ranges", "").lower() != "bytes":
+        return 0
+    if headers.get("Content-Encoding", "identity") != "identity":
+        return 0
+    try:
+        size = int(headers.get("Content-Length", 0))
+    except ValueError:
+        return 0
+    return size if size >= _PARALLEL_DOWNLOAD_MIN_SIZE else 0
+
+
+def _if_range_validator(headers) -> str:
+    """
+    Returns the validator to send as If-Range, which must be a strong ETag or a
+    Last-Modified date, or an empty string if the response carries neither.
+    """
+    etag = headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified", "")
+
+
+def _download_range(uri: str, dst: Path, lo: int, hi: int, if_range: str) -> bool:
+    """
+    Writes bytes lo..hi of the resource into their region of dst. Returns False
+    if the server did not answer with exactly that range.
+    """
+    headers = {"Range": f"bytes={lo}-{hi}"}
+    if if_range:
+        # The server sends the full body instead of mixing parts of different
+        # versions of the resource.
+        headers["If-Range"] = if_range
+    with _HTTP_SESSION.get(uri, stream=True, timeout=30, headers=headers) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            return False
+        with open(dst, "r+b") as f:
+            f.seek(lo)
+            shutil.copyfileobj(r.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+            return f.tell() == hi + 1
+
+
+def _parallel_download(
+    uri: str,
+    dst: Path,
+    size: int,
+    if_range: str = "",
+    conns: int = _PARALLEL_DOWNLOAD_CONNECTIONS,
+) -> bool:
+    """
+    Downloads `size` bytes of the resource into dst with `conns` parallel range
+    requests, each writing into its own region of the preallocated file.
+    Returns False if any range was not served as requested.
+    """
+    with open(dst, "wb") as f:
+        _preallocate(f, {"Content-Length": size})
+        f.truncate(size)
+    part = -(-size // conns)
+    ranges = [(lo, min(lo + part, size) - 1) for lo in range(0, size, part)]
+    with ThreadPoolExecutor(max_workers=len(ranges)) as ex:
+        futures = [
+            ex.submit(_download_range, uri, dst, lo, hi, if_range) for lo, hi in ranges
+        ]
+        return all([future.result() for future in futures])
+
 
 class DataProvider:
     def __init__(self, root_path: str | Path, base_path: str | Path):
@@ -33,23 +156,46 @@ class BuiltinDataProvider(DataProvider):
 
 
 class BaseDownloadDataProvider(DataProvider):
-    def __init__(self, uri: str, base_path: str | Path, force_download: bool = True):
+    def __init__(self, uri: str, base_path: str | Path, force_download: bool = False):
         super().__init__(Path(base_path), "")
 
         self.uri = uri
         self.force_download = force_download
         self.loaded = False
+        self.owns_download = False
 
     def ensure_data_path(self, path: str | Path):
+        self.ensure_loaded()
+        return super().ensure_data_path(path)
+
+    def ensure_loaded(self):
         self.ensure_base_path()
-        if not self.loaded:
+        cache_key = (self.uri, self.base_path.resolve())
+        if cache_key in _DOWNLOAD_CACHE:
+            self.loaded = True
+            return
+        if self.loaded:
+            self.revalidate()
+        else:
             self.download()
-        return super().ensure_data_path(path)
+            self.owns_download = True
+        _DOWNLOAD_CACHE.add(cache_key)
+
+    def revalidate(self):
+        pass
 
     def cleanup(self):
+        # Downloads are kept as a cache for later runs unless a fresh download
+        # was requested explicitly. Only the provider that performed the
+        # download removes it, other providers may share the same base path.
+        if not (self.force_download and self.owns_download):
+            return True
         try:
             if self.base_path.exists():
                 shutil.rmtree(self.base_path)
+            _DOWNLOAD_CACHE.discard((self.uri, self.base_path.resolve()))
+            self.loaded = False
+            self.owns_download = False
         except Exception as e:
             print(f"Cleanup failed: {e}")
         return True
@@ -59,39 +205,144 @@ class BaseDownloadDataProvider(DataProvider):
 
 
 class DownloadDataProvider(BaseDownloadDataProvider):
-    def __init__(self, uri: str, base_path: str | Path, force_download: bool = True):
+    def __init__(self, uri: str, base_path: str | Path, force_download: bool = False):
         super().__init__(uri, base_path, force_download)
 
-        self.filename = Path(
-            urlparse(self.uri).path
-        ).name  # does not support indirect uri's
+        self.filename = _uri_filename(self.uri)
         self.file_path = self.base_path / self.filename
+        self.etag_path = self.base_path / (self.filename + ".etag")
         self.loaded = False if self.force_download else self.file_path.exists()
+        self.cache_validated = False
+
+    def revalidate(self):
+        if self.cache_validated or not self.etag_path.exists():
+            return
+        # The conditional GET only transfers the body if the file changed on
+        # the server.
+        try:
+            self.download()
+        except requests.RequestException:
+            # Keep working with the cached copy if the server is unreachable.
+            self.cache_validated = True
 
     def download(self):
         self.ensure_base_path()
+        validators = self._stream_to_file(self.file_path)
+        if validators is not None:
+            self.etag_path.write_text(validators, encoding="utf-8")
+        self.loaded = True
 
-        tmp_file = self.base_path / (self.filename + ".tmp")
+    def _conditional_headers(self) -> dict[str, str]:
+        if not self.loaded or not self.etag_path.exists():
+            return {}
+        etag, _, last_modified = self.etag_path.read_text(encoding="utf-8").partition(
+            "\n"
+        )
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def _stream_to_file(self, target: Path) -> str | None:
+        """
+        Streams the resource to the target path and returns its cache validators,
+        which the caller persists once the download has been processed. Returns
+        None without touching the target if the server reports the cached copy as
+        not modified.
+        """
+        tmp_file = target.with_name(target.name + ".tmp")
         try:
-            with requests.get(self.uri, stream=True, timeout=30) as r:
+            with _HTTP_SESSION.get(
+                self.uri,
+                stream=True,
+                timeout=30,
+                headers=self._conditional_headers(),
+            ) as r:
+                if r.status_code == 304:
+                    self.cache_validated = True
+                    return None
                 r.raise_for_status()
-                with open(tmp_file, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-            tmp_file.replace(self.file_path)
-            self.loaded = True
+                size = _parallel_download_size(r.headers)
+                # The headers of the conditional GET stand in for a HEAD
+                # request; its body is only read if the server does not serve
+                # the range requests, e.g. because it ignores Range headers.
+                if not (
+                    size
+                    and _parallel_download(
+                        self.uri,
+                        tmp_file,
+                        size,
+                        if_range=_if_range_validator(r.headers),
+                    )
+                ):
+                    r.raw.decode_content = True
+                    with open(tmp_file, "wb") as f:
+                        _preallocate(f, r.headers)
+                        shutil.copyfileobj(r.raw, f, length=_DOWNLOAD_CHUNK_SIZE)
+                        f.truncate()
+            tmp_file.replace(target)
+            self.cache_validated = True
+            return _cache_validators(r.headers)
         finally:
             if tmp_file.exists():
                 tmp_file.unlink(missing_ok=True)
 
 
 class DownloadZIPDataProvider(DownloadDataProvider):
-    def __init__(self, uri: str, base_path: str | Path, force_download: bool = True):
+    def __init__(self, uri: str, base_path: str | Path, force_download: bool = False):
         super().__init__(uri, base_path, force_download)
-        self.loaded = False if self.force_download else any(self.base_path.iterdir())
+        self.loaded = (
+            False
+            if self.force_download
+            else self.base_path.exists() and any(self.base_path.iterdir())
+        )
+
+    def revalidate(self):
+        # The validators are only stored after a complete extraction, so a
+        # cache without them may be partially extracted and is fetched again.
+        if not self.etag_path.exists():
+            self.download()
+            return
+        super().revalidate()
 
     def download(self):
-        req = requests.get(self.uri)
-        zip = zipfile.ZipFile(io.BytesIO(req.content))
-        zip.extractall(self.base_path)
+        self.ensure_base_path()
+        # Stream the archive to disk instead of buffering it in memory;
+        # ZipFile then reads members via the central directory of the file.
+        validators = self._stream_to_file(self.file_path)
+        if validators is None:
+            self.loaded = True
+            return
+        try:
+            with zipfile.ZipFile(self.file_path) as zip_file:
+                members = [info for info in zip_file.infolist() if not info.is_dir()]
+            if members:
+                with ThreadPoolExecutor(max_workers=min(8, len(members))) as ex:
+                    list(ex.map(self._extract_member, members))
+        except BaseException:
+            # Validators of a previous version no longer describe the
+            # partially replaced contents.
+            self.etag_path.unlink(missing_ok=True)
+            raise
+        finally:
+            self.file_path.unlink(missing_ok=True)
+        self.etag_path.write_text(validators, encoding="utf-8")
         self.loaded = True
+
+    def _extract_member(self, info: zipfile.ZipInfo):
+        target = (self.base_path / info.filename).resolve()
+        if not target.is_relative_to(self.base_path.resolve()):
+            raise ValueError(
+                f"ZIP member {info.filename} would be extracted outside of {self.base_path}."
+            )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # ZipFile handles are not thread-safe, so each worker opens its own.
+        # zlib releases the GIL while inflating, so members decompress in parallel.
+        with (
+            zipfile.ZipFile(self.file_path) as zip_file,
+            zip_file.open(info) as src,
+            open(target, "wb") as dst,
+        ):
+            shutil.copyfileobj(src, dst, length=_DOWNLOAD_CHUNK_SIZE)
@@ -1,16 +1,24 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 from pathlib import Path
-from typing import Literal, Union
+from typing import Callable, Iterable, Iterator, Literal, Union
 import logging
 import sys
 
+import numpy as np
 import pandas as pd
+from google.protobuf.internal import api_implementation
 from lxml import etree
 
 from osi3 import osi_object_pb2
 
 from osi_utilities import ChannelSpecification, MessageType, open_channel
-from osc_validation.utils.utils import timestamp_osi_to_float, rotatePointZYX
+from osc_validation.utils.utils import (
+    timestamp_osi_to_float,
+    rotatePointZYX,
+    rotatePointsZYX,
+)
 from .init_transforms import compute_close_to_trajectory_start_xy
 from .init_transforms.models import InitPoseOverride
 from .xosc_builders import (
@@ -20,9 +28,7 @@ from .xosc_builders import (
     append_simulation_time_stop_trigger,
     append_teleport_private_action,
     append_vehicle,
-    append_world_position,
     build_open_scenario_root,
-    write_xosc_tree,
 )
 
 XOSC_VERSION_MAJOR = 1
@@ -43,6 +49,25 @@ class OSI2OSCMovingObject:
     Class containing relevant data to convert from OSI to OpenSCENARIO
     """
 
+    __slots__ = (
+        "id",
+        "entity_ref",
+        "length_static",
+        "width_static",
+        "height_static",
+        "type",
+        "vehicle_type",
+        "bbcenter_to_rear_x",
+        "bbcenter_to_rear_y",
+        "bbcenter_to_rear_z",
+        "osc_vehicle_name",
+        "osc_trajectory_name",
+        "_traj_rows",
+        "_trajectory_arrays",
+        "_world_positions",
+        "_trajectory_df",
+    )
+
     osi_vehicle_type_to_osc_category: dict[int, str | None] = {
         0: None,  # unknown
         1: None,  # other
@@ -65,6 +90,14 @@ class OSI2OSCMovingObject:
     }
     """OSI 3.7.0 to OpenSCENARIO XML 1.3.0 Mapping"""
 
+    TRAJECTORY_COLUMNS = ["timestamp", "x", "y", "z", "h", "p", "r"]
+
+    _VERTEX_TEMPLATE = (
+        '<Vertex time="%s"><Position>'
+        '<WorldPosition x="%s" y="%s" z="%s" h="%s" p="%s" r="%s"/>'
+        "</Position></Vertex>"
+    )
+
     def __init__(
         self,
         id: str,
@@ -82,14 +115,19 @@ class OSI2OSCMovingObject:
         self.entity_ref = (
             f"osi_moving_object_{self.id}" if not host_vehicle else "Ego"
         )  # name of ScenarioObject
+        self.osc_vehicle_name = f"osi_moving_object_vehicle_{self.id}"
+        self.osc_trajectory_name = f"{self.osc_vehicle_name}_trajectory"
         self.length_static = length_static
         self.width_static = width_static
         self.height_static = height_static
         self.type = type
         self.vehicle_type = vehicle_type
-        self.trajectory = pd.DataFrame(
-            columns=["timestamp", "x", "y", "z", "h", "p", "r"]
+        self._traj_rows: list[tuple] = []
+        self._trajectory_arrays: tuple[np.ndarray, ...] = tuple(
+            np.empty(0) for _ in self.TRAJECTORY_COLUMNS
         )
+        self._world_positions: tuple[np.ndarray, ...] | None = None
+        self._trajectory_df: pd.DataFrame | None = None
         if (
             bbcenter_to_rear_x == None
             and bbcenter_to_rear_y == None
@@ -109,30 +147,55 @@ class OSI2OSCMovingObject:
         else:
             raise RuntimeError("Problem with bbcenter_to_rear")
 
+    @property
+    def trajectory_arrays(self) -> tuple[np.ndarray, ...]:
+        """Trajectory samples as parallel arrays in the order of TRAJECTORY_COLUMNS.
+
+        Rows appended since the last access are moved into the arrays, which
+        frees the row buffer used during ingestion.
+        """
+        if self._traj_rows:
+            samples = np.asarray(self._traj_rows, dtype=float)
+            self._traj_rows = []
+            if not len(self._trajectory_arrays[0]):
+                # Usual case of a single chunk: use the columns without copying
+                self._trajectory_arrays = tuple(samples.T)
+            else:
+                self._trajectory_arrays = tuple(
+                    np.concatenate((column, new_column))
+                    for column, new_column in zip(self._trajectory_arrays, samples.T)
+                )
+            self._world_positions = None
+            self._trajectory_df = None
+        return self._trajectory_arrays
+
+    @property
+    def trajectory(self) -> pd.DataFrame:
+        """Trajectory samples as DataFrame with the columns TRAJECTORY_COLUMNS.
+
+        The DataFrame is kept until further rows are appended.
+        """
+        trajectory_arrays = self.trajectory_arrays
+        if self._trajectory_df is None:
+            self._trajectory_df = pd.DataFrame(
+                dict(zip(self.TRAJECTORY_COLUMNS, trajectory_arrays))
+            )
+        return self._trajectory_df
+
     def append_trajectory_row(self, timestamp, x, y, z, h, p, r):
-        """Appends a new dataframe row to build a full trajectory.
+        """Appends a new row to build a full trajectory.
 
         Positions are given in OSI coordinates and describe the center of the
         bounding box of the object.
         """
-        new_row = pd.DataFrame(
-            {
-                "timestamp": [timestamp],
-                "x": [x],
-                "y": [y],
-                "z": [z],
-                "h": [h],
-                "p": [p],
-                "r": [r],
-            }
-        )
-        if self.trajectory.empty:
-            self.trajectory = new_row
-        else:
-            self.trajectory = pd.concat(
-                [self.trajectory, new_row],
-                ignore_index=True,
-            )
+        self._traj_rows.append((timestamp, x, y, z, h, p, r))
+
+    def extend_trajectory(self, rows: Iterable[tuple]):
+        """Appends multiple rows, each given as (timestamp, x, y, z, h, p, r).
+
+        See append_trajectory_row for the coordinate conventions.
+        """
+        self._traj_rows.extend(rows)
 
     def build_osc_scenario_object(self):
         """
@@ -146,7 +209,7 @@ class OSI2OSCMovingObject:
         append_vehicle(
             xml_scenario_object,
             XoscVehicle(
-                name=f"osi_moving_object_vehicle_{self.id}",
+                name=self.osc_vehicle_name,
                 category=osc_vehicle_category,
                 center_x=str(-self.bbcenter_to_rear_x),
                 center_y=str(-self.bbcenter_to_rear_y),
@@ -168,32 +231,49 @@ class OSI2OSCMovingObject:
         """
         Return OpenSCENARIO XML Trajectory element for this moving object
         """
-        self.osc_trajectory_name = f"osi_moving_object_vehicle_{self.id}_trajectory"
         xml_trajectory = etree.Element(
             "Trajectory", closed="false", name=self.osc_trajectory_name
         )
         xml_shape = etree.SubElement(xml_trajectory, "Shape")
-        xml_polyline = etree.SubElement(xml_shape, "Polyline")
-        for i, point in self.trajectory.iterrows():
-            xml_vertex = etree.SubElement(
-                xml_polyline, "Vertex", time=str(point["timestamp"])
-            )
-            xml_position = etree.SubElement(xml_vertex, "Position")
-            x, y, z, h, p, r = self._to_world_position(point)
-            append_world_position(
-                xml_position,
-                WorldPosition(x=x, y=y, z=z, h=h, p=p, r=r),
-                as_float=False,
-            )
+        timestamps = self.trajectory_arrays[0]
+        world_positions = self._to_world_positions()
+        # Format each column in one pass; str() of the Python floats keeps the
+        # shortest round-trip representation.
+        columns = [
+            list(map(str, values.tolist())) for values in (timestamps, *world_positions)
+        ]
+        # The vertices are a regular repetition of the same subtree, so the
+        # polyline is formatted as one string and parsed once by lxml instead of
+        # creating every node through the element API. The formatted floats
+        # contain no characters that need escaping.
+        xml_polyline = etree.fromstring(
+            "<Polyline>"
+            + "".join(map(self._VERTEX_TEMPLATE.__mod__, zip(*columns)))
+            + "</Polyline>"
+        )
+        xml_shape.append(xml_polyline)
         return xml_trajectory
 
-    def _to_world_position(self, point):
-        x = point["x"]
-        y = point["y"]
-        z = point["z"]
-        h = point["h"]
-        p = point["p"]
-        r = point["r"]
+    def _to_world_positions(self) -> tuple[np.ndarray, ...]:
+        """Vectorized _to_world_position over all trajectory samples.
+
+        The result is kept until further rows are appended.
+        """
+        _, x, y, z, h, p, r = self.trajectory_arrays
+        if self._world_positions is not None:
+            return self._world_positions
+        rx, ry, rz = rotatePointsZYX(
+            self.bbcenter_to_rear_x,
+            self.bbcenter_to_rear_y,
+            -self.height_static / 2,  # projection onto ground plane of bounding box
+            h,
+            p,
+            r,
+        )
+        self._world_positions = (x + rx, y + ry, z + rz, h, p, r)
+        return self._world_positions
+
+    def _to_world_position(self, x, y, z, h, p, r):
         rx, ry, rz = rotatePointZYX(
             self.bbcenter_to_rear_x,
             self.bbcenter_to_rear_y,
@@ -208,12 +288,13 @@ class OSI2OSCMovingObject:
         return x, y, z, h, p, r
 
     def build_trajectory_start_override(self) -> InitPoseOverride:
-        if self.trajectory.empty:
+        trajectory_arrays = self.trajectory_arrays
+        if not len(trajectory_arrays[0]):
             raise RuntimeError(
                 f"Object '{self.entity_ref}' has no trajectory samples."
             )
-        first_point = self.trajectory.iloc[0]
-        x, y, z, h, p, r = self._to_world_position(first_point)
+        _, *first_pose = (column[0].item() for column in trajectory_arrays)
+        x, y, z, h, p, r = self._to_world_position(*first_pose)
         return InitPoseOverride(
             entity_ref=self.entity_ref,
             object_id=int(self.id),
@@ -247,11 +328,11 @@ class OSI2OSCMovingObject:
                                             <Trajectory closed="false" name="x">
                                             ...
         """
-        xml_act = etree.Element("Act", name=f"osi_moving_object_vehicle_{self.id}_act")
+        xml_act = etree.Element("Act", name=f"{self.osc_vehicle_name}_act")
         xml_maneuver_group = etree.SubElement(
             xml_act,
             "ManeuverGroup",
-            name=f"osi_moving_object_vehicle_{self.id}_maneuvergroup",
+            name=f"{self.osc_vehicle_name}_maneuvergroup",
             maximumExecutionCount="1",
         )
         xml_actors = etree.SubElement(
@@ -306,63 +387,73 @@ def parse_moving_objects(
     """
     Extracts all moving objects from an OSI SensorView or GroundTruth trace.
     """
-    my_moving_objects = []
     with open_channel(osi_trace_spec) as channel_reader:
         message_type = channel_reader.get_channel_specification().message_type
         assert message_type in (MessageType.SENSOR_VIEW, MessageType.GROUND_TRUTH)
-        for osi_message in channel_reader:
-            current_timestamp = timestamp_osi_to_float(osi_message.timestamp)
-            osi_moving_object_list = (
-                osi_message.global_ground_truth.moving_object
-                if message_type == MessageType.SENSOR_VIEW
-                else osi_message.moving_object
+        moving_objects, _ = _collect_moving_objects(
+            channel_reader, message_type, host_vehicle_id
+        )
+    return moving_objects
+
+
+def _collect_moving_objects(
+    osi_messages: Iterable,
+    message_type: MessageType,
+    host_vehicle_id: int | None,
+) -> tuple[list[OSI2OSCMovingObject], float | None]:
+    """
+    Extracts all moving objects from OSI SensorView or GroundTruth messages.
+    Also returns the timestamp of the last message, or None if there was none.
+    """
+    moving_objects_by_id: dict[int, OSI2OSCMovingObject] = {}
+    # Samples are buffered per object and handed over in bulk after reading
+    rows_by_id: dict[int, list[tuple]] = {}
+    current_timestamp = None
+    is_sensor_view = message_type == MessageType.SENSOR_VIEW
+    for osi_message in osi_messages:
+        current_timestamp = timestamp_osi_to_float(osi_message.timestamp)
+        osi_moving_object_list = (
+            osi_message.global_ground_truth.moving_object
+            if is_sensor_view
+            else osi_message.moving_object
+        )
+        for osi_moving_object in osi_moving_object_list:
+            current_moving_object_id = osi_moving_object.id.value
+            rows = rows_by_id.get(current_moving_object_id)
+            if rows is None:
+                dimension = osi_moving_object.base.dimension  # use first occurrence
+                bbcenter_to_rear = osi_moving_object.vehicle_attributes.bbcenter_to_rear
+                moving_object = OSI2OSCMovingObject(
+                    id=current_moving_object_id,
+                    length_static=dimension.length,
+                    width_static=dimension.width,
+                    height_static=dimension.height,
+                    type=osi_moving_object.type,
+                    vehicle_type=osi_moving_object.vehicle_classification.type,
+                    bbcenter_to_rear_x=bbcenter_to_rear.x,
+                    bbcenter_to_rear_y=bbcenter_to_rear.y,
+                    bbcenter_to_rear_z=bbcenter_to_rear.z,
+                    host_vehicle=(current_moving_object_id == host_vehicle_id),
+                )
+                moving_objects_by_id[current_moving_object_id] = moving_object
+                rows = rows_by_id[current_moving_object_id] = []
+            position = osi_moving_object.base.position
+            orientation = osi_moving_object.base.orientation
+            rows.append(
+                (
+                    current_timestamp,
+                    position.x,
+                    position.y,
+                    position.z,
+                    orientation.yaw,
+                    orientation.pitch,
+                    orientation.roll,
+                )
             )
-            for osi_moving_object in osi_moving_object_list:
-                current_moving_object_id = osi_moving_object.id.value
-                if not any(
-                    obj.id == current_moving_object_id for obj in my_moving_objects
-                ):
-                    object_to_add = OSI2OSCMovingObject(
-                        id=current_moving_object_id,
-                        length_static=osi_moving_object.base.dimension.length,  # use first occurrence
-                        width_static=osi_moving_object.base.dimension.width,  # use first occurrence
-                        height_static=osi_moving_object.base.dimension.height,  # use first occurrence
-                        type=osi_moving_object.type,
-                        vehicle_type=osi_moving_object.vehicle_classification.type,
-                        bbcenter_to_rear_x=osi_moving_object.vehicle_attributes.bbcenter_to_rear.x,
-                        bbcenter_to_rear_y=osi_moving_object.vehicle_attributes.bbcenter_to_rear.y,
-                        bbcenter_to_rear_z=osi_moving_object.vehicle_attributes.bbcenter_to_rear.z,
-                        host_vehicle=(osi_moving_object.id.value == host_vehicle_id),
-                    )
-                    object_to_add.append_trajectory_row(
-                        current_timestamp,
-                        osi_moving_object.base.position.x,
-                        osi_moving_object.base.position.y,
-                        osi_moving_object.base.position.z,
-                        osi_moving_object.base.orientation.yaw,
-                        osi_moving_object.base.orientation.pitch,
-                        osi_moving_object.base.orientation.roll,
-                    )
-                    my_moving_objects.append(object_to_add)
-                else:
-                    object_to_modify = next(
-                        (
-                            obj
-                            for obj in my_moving_objects
-                            if obj.id == current_moving_object_id
-                        ),
-                        None,
-                    )
-                    object_to_modify.append_trajectory_row(
-                        current_timestamp,
-                        osi_moving_object.base.position.x,
-                        osi_moving_object.base.position.y,
-                        osi_moving_object.base.position.z,
-                        osi_moving_object.base.orientation.yaw,
-                        osi_moving_object.base.orientation.pitch,
-                        osi_moving_object.base.orientation.roll,
-                    )
-    return my_moving_objects
+    for moving_object_id, rows in rows_by_id.items():
+        moving_objects_by_id[moving_object_id].extend_trajectory(rows)
+    # Dicts keep insertion order, i.e. the order of first occurrence in the trace
+    return list(moving_objects_by_id.values()), current_timestamp
 
 
 def osi2osc(
@@ -375,6 +466,7 @@ def osi2osc(
         "close_to_trajectory_start",
     ] = "origin",
     init_pose_close_threshold_m: float | None = None,
+    max_workers: int | None = 1,
 ) -> Path:
     """
     Converts an OSI GroundTruth or SensorView trace to an OpenSCENARIO XML file
@@ -387,12 +479,21 @@ def osi2osc(
         init_pose_policy: Optional init pose policy. Default "origin" preserves
             converter defaults (`0,0,0` teleport init).
         init_pose_close_threshold_m: Threshold distance in meters for the "close_to_trajectory_start" init pose policy. Default is 0.5 meters.
+        max_workers (int, optional): Number of processes building the Acts of the moving objects in parallel.
+            Default 1 builds them in the calling process; None uses one process per CPU.
     Returns:
         Path: Valid path to the output OpenSCENARIO file if the conversion was successful.
     Raises:
         AssertionError: If the input OSI trace is not of type SensorView or GroundTruth.
     """
 
+    if api_implementation.Type() == "python":
+        # protobuf >= 4.21 defaults to the upb backend; the pure-Python one is
+        # only active if forced via PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION.
+        logging.warning(
+            "The pure-Python protobuf implementation is active, parsing large OSI traces will be slow. Unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION to use the upb backend."
+        )
+
     with open_channel(osi_trace_spec) as osi_trace_channel_reader:
         resolved_spec = osi_trace_channel_reader.get_channel_specification()
         assert resolved_spec.message_type in (
@@ -403,26 +504,25 @@ def osi2osc(
         msg = next(osi_trace_iterator, None)
         if msg is None:
             raise ValueError(f"Input OSI trace ({resolved_spec.path}) is empty.")
-        stop_timestamp = timestamp_osi_to_float(msg.timestamp)
-        for stop_message in osi_trace_iterator:
-            stop_timestamp = timestamp_osi_to_float(stop_message.timestamp)
         host_vehicle_id = msg.host_vehicle_id.value if msg else None
         if host_vehicle_id is None:
             logging.warning(
                 f"Input OSI trace ({resolved_spec.path}) has no specified host_vehicle_id. The output OpenSCENARIO file will not have a specified ego vehicle."
             )
+        # Continue with the peeked message so that the trace is parsed only once
+        my_moving_objects, stop_timestamp = _collect_moving_objects(
+            itertools.chain([msg], osi_trace_iterator),
+            resolved_spec.message_type,
+            host_vehicle_id,
+        )
 
-    my_moving_objects = parse_moving_objects(osi_trace_spec, host_vehicle_id)
-    # Order objects so that Ego is always added first (in entities and init actions)
-    ego_objs = [obj for obj in my_moving_objects if obj.entity_ref == "Ego"]
-    other_objs = [obj for obj in my_moving_objects if obj.entity_ref != "Ego"]
-    my_moving_objects = ego_objs + other_objs
+    # Order objects so that Ego is always added first (in entities and init actions);
+    # the sort is stable, so the other objects keep their order of occurrence.
+    my_moving_objects.sort(key=lambda obj: obj.entity_ref != "Ego")
 
-    xml_scenario_objects = []
-    xml_acts = []
-    for obj in my_moving_objects:
-        xml_scenario_objects.append(obj.build_osc_scenario_object())
-        xml_acts.append(obj.build_act())
+    xml_scenario_objects = [
+        obj.build_osc_scenario_object() for obj in my_moving_objects
+    ]
 
     xml_root, xml_entities, xml_storyboard = build_open_scenario_root(
         XoscHeader(
@@ -502,46 +602,136 @@ def osi2osc(
                 as_float=False,
             )
     story_name = "Story1"
-    xml_story = etree.SubElement(xml_storyboard, "Story", name=story_name)
-    for xml_act in xml_acts:
-        xml_story.append(xml_act)
     if STOPTRIGGER:
-        if STOPTRIGGER_CONDITION == "StoryboardElementStateCondition":
-            xml_storyboard_stop_trigger = etree.SubElement(
-                xml_storyboard, "StopTrigger"
-            )
-            xml_stop_trigger_condition_group = etree.SubElement(
-                xml_storyboard_stop_trigger, "ConditionGroup"
-            )
-            xml_stop_trigger_condition = etree.SubElement(
-                xml_stop_trigger_condition_group,
-                "Condition",
-                name="QuitCondition",
-                delay="0",
-                conditionEdge="rising",
-            )
-            xml_stop_trigger_byvalue_condition = etree.SubElement(
-                xml_stop_trigger_condition, "ByValueCondition"
-            )
-            xml_stop_trigger_state_condition = etree.SubElement(
-                xml_stop_trigger_byvalue_condition,
-                "StoryboardElementStateCondition",
-                storyboardElementType="story",
-                storyboardElementRef=story_name,
-                state="completeState",
-            )
-        elif STOPTRIGGER_CONDITION == "SimulationTimeCondition":
-            append_simulation_time_stop_trigger(
-                xml_storyboard,
-                stop_timestamp,
-                delay="0",
-                as_float=False,
-            )
+        STOP_TRIGGER_BUILDERS[STOPTRIGGER_CONDITION](
+            xml_storyboard, story_name, stop_timestamp
+        )
 
-    write_xosc_tree(path_xosc, xml_root)
+    _write_xosc_streaming(
+        path_xosc, xml_root, story_name, my_moving_objects, max_workers
+    )
     return path_xosc
 
 
+def _append_story_complete_stop_trigger(
+    xml_storyboard: etree._Element, story_name: str, stop_timestamp: float
+):
+    xml_storyboard_stop_trigger = etree.SubElement(xml_storyboard, "StopTrigger")
+    xml_stop_trigger_condition_group = etree.SubElement(
+        xml_storyboard_stop_trigger, "ConditionGroup"
+    )
+    xml_stop_trigger_condition = etree.SubElement(
+        xml_stop_trigger_condition_group,
+        "Condition",
+        name="QuitCondition",
+        delay="0",
+        conditionEdge="rising",
+    )
+    xml_stop_trigger_byvalue_condition = etree.SubElement(
+        xml_stop_trigger_condition, "ByValueCondition"
+    )
+    etree.SubElement(
+        xml_stop_trigger_byvalue_condition,
+        "StoryboardElementStateCondition",
+        storyboardElementType="story",
+        storyboardElementRef=story_name,
+        state="completeState",
+    )
+
+
+def _append_simulation_time_stop_trigger(
+    xml_storyboard: etree._Element, story_name: str, stop_timestamp: float
+):
+    append_simulation_time_stop_trigger(
+        xml_storyboard,
+        stop_timestamp,
+        delay="0",
+        as_float=False,
+    )
+
+
+# Stop trigger builders selectable via STOPTRIGGER_CONDITION
+STOP_TRIGGER_BUILDERS: dict[str, Callable[[etree._Element, str, float], None]] = {
+    "StoryboardElementStateCondition": _append_story_complete_stop_trigger,
+    "SimulationTimeCondition": _append_simulation_time_stop_trigger,
+}
+
+
+def _write_xosc_streaming(
+    path_xosc: Path,
+    xml_root: etree._Element,
+    story_name: str,
+    moving_objects: list[OSI2OSCMovingObject],
+    max_workers: int | None = 1,
+):
+    """
+    Writes the OpenSCENARIO tree with a Story holding one Act per moving object.
+
+    The Acts contain the full polyline trajectories and dominate the size of the
+    document, so they are built and serialized one at a time instead of holding
+    all of them in the tree. The Story is placed after the Init of the
+    Storyboard, before its StopTrigger.
+    """
+    with open(path_xosc, "wb") as f:
+        with etree.xmlfile(f, encoding="UTF-8") as xf:
+            xf.write_declaration()
+            with xf.element(xml_root.tag):
+                for xml_element in xml_root:
+                    if xml_element.tag != "Storyboard":
+                        _write_indented(xf, xml_element, 1)
+                        continue
+                    xf.write("\n  ")
+                    with xf.element(xml_element.tag):
+                        for xml_storyboard_element in xml_element:
+                            if xml_storyboard_element.tag == "StopTrigger":
+                                break
+                            _write_indented(xf, xml_storyboard_element, 2)
+                        xf.write("\n    ")
+                        with xf.element("Story", name=story_name):
+                            for xml_act in _iter_acts(moving_objects, max_workers):
+                                _write_indented(xf, xml_act, 3)
+                            xf.write("\n    ")
+                        for xml_storyboard_element in xml_element.iterfind(
+                            "StopTrigger"
+                        ):
+                            _write_indented(xf, xml_storyboard_element, 2)
+                        xf.write("\n  ")
+                xf.write("\n")
+        # write_xosc_tree ends the document with a newline after the root
+        f.write(b"\n")
+
+
+def _write_indented(xf, xml_element: etree._Element, level: int):
+    # Matches the layout of the pretty-printed tree written by write_xosc_tree.
+    etree.indent(xml_element, level=level)
+    xf.write("\n" + "  " * level)
+    xf.write(xml_element)
+
+
+def _iter_acts(
+    moving_objects: list[OSI2OSCMovingObject], max_workers: int | None
+) -> Iterator[etree._Element]:
+    """
+    Yields the Act of each moving object in order.
+
+    With more than one worker the Acts are built in a process pool, since
+    formatting the polylines is bound to the GIL. The workers return the
+    serialized Acts, which are parsed again for the streaming writer.
+    """
+    if max_workers == 1 or len(moving_objects) < 2:
+        while moving_objects:
+            # Drop each object once its Act is built
+            yield moving_objects.pop(0).build_act()
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for xml_act in executor.map(_build_act_xml, moving_objects):
+            yield etree.fromstring(xml_act)
+
+
+def _build_act_xml(moving_object: OSI2OSCMovingObject) -> bytes:
+    return etree.tostring(moving_object.build_act())
+
+
 def create_argparser():
     parser = argparse.ArgumentParser(
         description="Convert an OSI GroundTruth or SensorView trace file to an OpenScenario XML file."
@@ -574,6 +764,12 @@ def create_argparser():
             "--init-pose-policy close_to_trajectory_start."
         ),
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Number of processes building the trajectories of the moving objects in parallel.",
+    )
     return parser
 
 
@@ -601,6 +797,7 @@ def main():
             path_xosc=path_xosc,
             init_pose_policy=args.init_pose_policy,
             init_pose_close_threshold_m=args.init_pose_close_threshold_m,
+            max_workers=args.max_workers,
         )
 
     except Exception as e:
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 
@@ -79,7 +79,7 @@ def build_open_scenario_root(
         "FileHeader",
         revMajor=str(header.rev_major),
         revMinor=str(header.rev_minor),
-        date=datetime.today().strftime("%Y-%m-%dT%H:%M:%S"),
+        date=datetime.now(timezone.utc).isoformat(timespec="seconds"),
         author=header.author,
         description=header.description,
     )
@@ -2,7 +2,11 @@ from pathlib import Path
 import similaritymeasures
 
 from osc_validation.metrics.osimetric import OSIMetric
-from osc_validation.metrics.trajectory_similarity import TrajectorySimilarityMetric
+from osc_validation.metrics.trajectory_similarity import (
+    TrajectorySimilarityMetric,
+    similarity_measures,
+    trajectory_xy,
+)
 from osi_utilities import ChannelSpecification
 from osc_validation.utils.utils import (
     get_trajectory_by_moving_object_id,
@@ -142,17 +146,13 @@ class TrajectoryAlignmentSimilarityMetric(OSIMetric):
                 "Reference and tool trajectories must have the same number of points for lag scan."
             )
 
-        ref_xy = ref_trajectory.loc[:, ["x", "y"]].values
-        tool_xy = tool_trajectory.loc[:, ["x", "y"]].values
         best_ref_xy, best_tool_xy, best_lag = self._align_xy_with_lag_scan(
-            ref_xy=ref_xy,
-            tool_xy=tool_xy,
+            ref_xy=trajectory_xy(ref_trajectory),
+            tool_xy=trajectory_xy(tool_trajectory),
             max_frames=lag_scan_max_frames,
         )
 
-        area = similaritymeasures.area_between_two_curves(best_ref_xy, best_tool_xy)
-        cl = similaritymeasures.curve_length_measure(best_ref_xy, best_tool_xy)
-        mae = similaritymeasures.mae(best_ref_xy, best_tool_xy)
+        area, cl, mae = similarity_measures(best_ref_xy, best_tool_xy)
 
         if result_file:
             with open(result_file, "w") as f:
@@ -3,23 +3,77 @@ import logging
 from pathlib import Path
 import os
 
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-
+import numpy as np
 import pandas as pd
 import similaritymeasures
 
 from osc_validation.metrics.osimetric import OSIMetric
 from osi_utilities import ChannelSpecification, MessageType
 from osc_validation.utils.utils import (
+    find_closest_trajectory,
     get_all_moving_object_ids,
+    get_all_trajectories,
     get_closest_trajectory,
     get_trajectory_by_moving_object_id,
+    get_trajectory_starts,
 )
 
 
+def area_between_two_curves(exp_data: np.ndarray, num_data: np.ndarray) -> float:
+    """
+    Vectorized similaritymeasures.area_between_two_curves.
+
+    For curves with the same number of points the library sums the shoelace
+    areas of the quadrilaterals between consecutive point pairs in a Python
+    loop with several NumPy calls per quadrilateral. Here all quadrilaterals
+    are measured at once. Curves of different length are passed to the
+    library, which first interpolates the shorter one.
+
+    Like the library, the vertices are used in curve order. makeQuad is meant
+    to reorder self-intersecting quadrilaterals, but its `is False` check never
+    matches the NumPy bool returned by is_simple_quad.
+    """
+    if len(exp_data) != len(num_data):
+        return similaritymeasures.area_between_two_curves(exp_data, num_data)
+    # Vertices of each quadrilateral: exp[i-1], exp[i], num[i], num[i-1]
+    x = np.stack(
+        (exp_data[:-1, 0], exp_data[1:, 0], num_data[1:, 0], num_data[:-1, 0]), axis=1
+    )
+    y = np.stack(
+        (exp_data[:-1, 1], exp_data[1:, 1], num_data[1:, 1], num_data[:-1, 1]), axis=1
+    )
+    area = 0.5 * np.abs(
+        np.sum(x * np.roll(y, 1, axis=1), axis=1)
+        - np.sum(y * np.roll(x, 1, axis=1), axis=1)
+    )
+    return np.sum(area)
+
+
+def _check_comparable(ref_trajectory: pd.DataFrame, tool_trajectory: pd.DataFrame):
+    if len(ref_trajectory) < 2 or len(tool_trajectory) < 2:
+        raise ValueError("Trajectories must contain at least 2 points for comparison.")
+
+    if len(ref_trajectory) != len(tool_trajectory):
+        raise ValueError(
+            "Reference and tool trajectories must have the same number of points. Check if the frame rate differs or if the given interval timestamps deviate (e.g. one trace shows timestamp rounding errors)."
+        )
+
+
+def trajectory_xy(trajectory: pd.DataFrame) -> np.ndarray:
+    # Extract the 2d curve once and share it between all measures and the plot
+    # instead of materializing a new array per use.
+    return np.ascontiguousarray(trajectory[["x", "y"]].to_numpy(), dtype=np.float64)
+
+
+def similarity_measures(
+    ref_xy: np.ndarray, tool_xy: np.ndarray
+) -> tuple[float, float, float]:
+    area = area_between_two_curves(ref_xy, tool_xy)
+    cl = similaritymeasures.curve_length_measure(ref_xy, tool_xy)
+    mae = similaritymeasures.mae(ref_xy, tool_xy)
+    return area, cl, mae
+
+
 class TrajectorySimilarityMetric(OSIMetric):
     # TODO(trajectory-similarity):
     # - Remove fragile length assumptions:
@@ -54,6 +108,7 @@ class TrajectorySimilarityMetric(OSIMetric):
         end_time: float = None,
         result_file: Path = None,
         time_tolerance: float = 0.0,
+        verbose_report: bool = True,
     ):
         """
         Compares the 2d-trajectories of a specified moving object in two OSI SensorView traces and computes similarity measures.
@@ -71,8 +126,9 @@ class TrajectorySimilarityMetric(OSIMetric):
             moving_object_id (int): The ID of the moving object in the reference trace whose trajectory will be compared with the corresponding moving object's trajectory in the tool trace.
             start_time (float, optional): Inclusive start time in seconds for the trajectory comparison. Defaults to None, in which case the trajectory is considered from the first frame.
             end_time (float, optional): Inclusive end time in seconds for the trajectory comparison. Defaults to None, in which case the trajectory is considered to the last frame.
-            result_file (Path, optional): Path to save the similarity report. If None, the report is logged to info level.
+            result_file (Path, optional): Path to save the similarity report. If None, the similarity measures are logged to info level and the report to debug level.
             time_tolerance (float, optional): Tolerance of the given start and end times used for inclusion of the start and end frames in the interval. Defaults to 0.0.
+            verbose_report (bool, optional): Whether the report lists both trajectories in addition to the similarity measures. Defaults to True.
         Returns:
             area (float): Area between the two trajectories' curves.
             cl (float): Curve length measure between the two trajectories.
@@ -81,15 +137,7 @@ class TrajectorySimilarityMetric(OSIMetric):
         Raises:
             KeyError: If the specified moving_object_id is not found in either trace.
         """
-        pd.set_option("display.precision", 15)
-
-        report = f"Report for Trajectory Similarity Metric '{self.name}':\n"
-
-        reference_moving_object_ids = get_all_moving_object_ids(reference_channel_spec)
-        if moving_object_id not in reference_moving_object_ids:
-            raise KeyError(
-                f"Moving object ID {moving_object_id} not found in reference trace (available ids: {reference_moving_object_ids})."
-            )
+        report_parts = [f"Report for Trajectory Similarity Metric '{self.name}':\n"]
 
         if start_time:
             start_time = start_time - time_tolerance
@@ -99,6 +147,16 @@ class TrajectorySimilarityMetric(OSIMetric):
         ref_trajectory = get_trajectory_by_moving_object_id(
             reference_channel_spec, moving_object_id, start_time, end_time
         )
+        if ref_trajectory.empty:
+            # Only scan the reference trace for all ids if the object has no
+            # samples in the interval, to tell a wrong id from a short trace.
+            reference_moving_object_ids = get_all_moving_object_ids(
+                reference_channel_spec
+            )
+            if moving_object_id not in reference_moving_object_ids:
+                raise KeyError(
+                    f"Moving object ID {moving_object_id} not found in reference trace (available ids: {reference_moving_object_ids})."
+                )
         assert (
             ref_trajectory is not None
         ), f"Could not extract trajectory for moving_object_id={moving_object_id} from reference trace file {reference_channel_spec}."
@@ -112,67 +170,75 @@ class TrajectorySimilarityMetric(OSIMetric):
             f"Comparing tool trace trajectory of moving object ID '{tool_trajectory.attrs['id']}' to reference trace trajectory of moving object ID '{moving_object_id}' in time range [{start_time}, {end_time}]."
         )
 
-        if len(ref_trajectory) < 2 or len(tool_trajectory) < 2:
-            raise ValueError(
-                "Trajectories must contain at least 2 points for comparison."
-            )
-
-        if len(ref_trajectory) != len(tool_trajectory):
-            raise ValueError(
-                "Reference and tool trajectories must have the same number of points. Check if the frame rate differs or if the given interval timestamps deviate (e.g. one trace shows timestamp rounding errors)."
-            )
+        _check_comparable(ref_trajectory, tool_trajectory)
 
-        report += f"Reference trajectory for moving object ID {moving_object_id}:\n"
-        report += ref_trajectory.loc[:, ["timestamp", "x", "y"]].to_string(index=False)
-        report += (
-            "\n###################################################################\n"
-        )
-        report += f"Tool trajectory for moving object ID {moving_object_id}:\n"
-        report += tool_trajectory.loc[:, ["timestamp", "x", "y"]].to_string(index=False)
-        report += (
-            "\n###################################################################\n"
-        )
+        # Formatting the trajectory tables is costly for long traces, so it is
+        # skipped if not requested or if the report is neither written nor logged.
+        if verbose_report and (
+            result_file or logging.getLogger().isEnabledFor(logging.DEBUG)
+        ):
+            separator = "\n###################################################################\n"
+            with pd.option_context("display.precision", 15):
+                for label, trajectory in (
+                    ("Reference", ref_trajectory),
+                    ("Tool", tool_trajectory),
+                ):
+                    report_parts.append(
+                        f"{label} trajectory for moving object ID {moving_object_id}:\n"
+                    )
+                    report_parts.append(
+                        trajectory.loc[:, ["timestamp", "x", "y"]].to_string(
+                            index=False
+                        )
+                    )
+                    report_parts.append(separator)
 
-        area = similaritymeasures.area_between_two_curves(
-            ref_trajectory.loc[:, ["x", "y"]].values,
-            tool_trajectory.loc[:, ["x", "y"]].values,
-        )
-        cl = similaritymeasures.curve_length_measure(
-            ref_trajectory.loc[:, ["x", "y"]].values,
-            tool_trajectory.loc[:, ["x", "y"]].values,
-        )
-        mae = similaritymeasures.mae(
-            ref_trajectory.loc[:, ["x", "y"]].values,
-            tool_trajectory.loc[:, ["x", "y"]].values,
-        )
+        ref_xy = trajectory_xy(ref_trajectory)
+        tool_xy = trajectory_xy(tool_trajectory)
+        area, cl, mae = similarity_measures(ref_xy, tool_xy)
 
-        report += (
+        report_parts.append(
             f"Similarity Measures:\n"
             f"Area between two curves:      {area}\n"
             f"Curve length measure:         {cl}\n"
             f"Mean absolute error (MAE):    {mae}\n"
         )
+        report = "".join(report_parts)
 
         if result_file:
             logging.info(f"Writing results to {result_file}")
             with open(result_file, "w") as f:
                 f.write(report)
         else:
-            logging.info(report)
+            logging.info(
+                "Trajectory similarity of moving object ID %s: area=%s, cl=%s, mae=%s",
+                moving_object_id,
+                area,
+                cl,
+                mae,
+            )
+            logging.debug(report)
 
         if self.plot_path:
+            # pyplot is imported on demand, its import takes a few hundred
+            # milliseconds and is not needed unless a plot is requested.
+            import matplotlib
+
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+
             plot_path = self.plot_path / f"trajectory_similarity_{moving_object_id}.png"
             plt.figure(figsize=(25.6, 14.4))
             plt.plot(
-                ref_trajectory["x"],
-                ref_trajectory["y"],
+                ref_xy[:, 0],
+                ref_xy[:, 1],
                 "o-",
                 label="Reference",
                 markersize=3,
             )
             plt.plot(
-                tool_trajectory["x"],
-                tool_trajectory["y"],
+                tool_xy[:, 0],
+                tool_xy[:, 1],
                 "o-",
                 label="Tool",
                 markersize=3,
@@ -184,6 +250,67 @@ class TrajectorySimilarityMetric(OSIMetric):
 
         return area, cl, mae
 
+    def compute_all(
+        self,
+        reference_channel_spec: ChannelSpecification,
+        tool_channel_spec: ChannelSpecification,
+        moving_object_ids: list[int] = None,
+        start_time: float = None,
+        end_time: float = None,
+        time_tolerance: float = 0.0,
+    ) -> dict[int, tuple[float, float, float]]:
+        """
+        Compares the 2d-trajectories of several moving objects like compute, but reads each trace only once.
+
+        No report or plot is produced.
+
+        Args:
+            reference_channel_spec (ChannelSpecification): Specification of the reference OSI SensorView trace channel.
+            tool_channel_spec (ChannelSpecification): Specification of the tool-generated OSI SensorView trace channel.
+            moving_object_ids (list[int], optional): IDs of the moving objects in the reference trace to compare. Defaults to None, in which case all moving objects present in the interval are compared.
+            start_time (float, optional): Inclusive start time in seconds for the trajectory comparison.
+            end_time (float, optional): Inclusive end time in seconds for the trajectory comparison.
+            time_tolerance (float, optional): Tolerance of the given start and end times. Defaults to 0.0.
+        Returns:
+            dict[int, tuple[float, float, float]]: (area, cl, mae) by reference moving object ID.
+        Raises:
+            KeyError: If a specified moving object has no trajectory in the interval of the reference trace.
+        """
+        if start_time:
+            start_time = start_time - time_tolerance
+        if end_time:
+            end_time = end_time + time_tolerance
+
+        ref_trajectories = get_all_trajectories(
+            reference_channel_spec, start_time, end_time
+        )
+        tool_trajectories = get_all_trajectories(
+            tool_channel_spec, start_time, end_time
+        )
+        if moving_object_ids is None:
+            moving_object_ids = list(ref_trajectories)
+        # The tool start positions are shared by the lookups of all objects.
+        tool_starts = get_trajectory_starts(tool_trajectories)
+
+        results = {}
+        for moving_object_id in moving_object_ids:
+            if moving_object_id not in ref_trajectories:
+                raise KeyError(
+                    f"Moving object ID {moving_object_id} not found in reference trace interval (available ids: {list(ref_trajectories)})."
+                )
+            ref_trajectory = ref_trajectories[moving_object_id]
+            tool_trajectory = find_closest_trajectory(
+                ref_trajectory, tool_trajectories, tool_starts
+            )
+            assert (
+                tool_trajectory is not None
+            ), f"Could not extract trajectory for moving_object_id={moving_object_id} from tool trace file {tool_channel_spec}."
+            _check_comparable(ref_trajectory, tool_trajectory)
+            results[moving_object_id] = similarity_measures(
+                trajectory_xy(ref_trajectory), trajectory_xy(tool_trajectory)
+            )
+        return results
+
 
 def create_argparser():
     parser = argparse.ArgumentParser(
@@ -14,6 +14,7 @@ Responsibilities
 * Expose optional OSI compliance assertions via the
   ``assert_osi_compliance`` session fixture.
 * Apply xfail markers from an optional test-profile file.
+* Default to ``--dist=loadfile`` for pytest-xdist runs.
 * Add validation metadata to the pytest report header.
 
 Presentation hooks that are specific to the built-in validation suite (e.g.
@@ -26,11 +27,11 @@ import datetime
 import importlib
 import importlib.util
 import pathlib
-from urllib.parse import urlparse
 import sys
 import uuid
 
 import pytest
+from google.protobuf.internal import api_implementation
 
 from osc_validation import __version__ as osc_validation_version
 from osc_validation.assertions import make_assert_osi_compliance
@@ -201,6 +202,31 @@ def pytest_addoption(parser):
     )
 
 
+def use_loadfile_distribution_by_default(config):
+    """
+    With pytest-xdist, keeps all tests of a module on one worker unless a
+    distribution mode was chosen explicitly, so module-scoped data is loaded
+    once per module instead of once per worker.
+
+    Must be called from a ``pytest_cmdline_main`` hook wrapper: pytest-xdist
+    replaces an unset distribution mode by ``load`` in that hook, after the
+    command line, ``PYTEST_ADDOPTS`` and ini ``addopts`` have been parsed.
+    """
+    option = config.option
+    if (
+        getattr(option, "numprocesses", None)
+        and getattr(option, "dist", None) == "no"
+        and not getattr(option, "distload", False)
+    ):
+        option.dist = "loadfile"
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_cmdline_main(config):
+    use_loadfile_distribution_by_default(config)
+    return (yield)
+
+
 def pytest_configure(config):
     """Initialise the tool when ``--tool`` is provided."""
     config._osc_validation_run_start_time = datetime.datetime.now().astimezone()
@@ -256,6 +282,7 @@ def _validation_metadata(config):
         "Tool Path": str(resolved_tool_path),
         "Tool Version": getattr(config, "_osc_tool_version", "unknown version"),
         "Validation Run Start Time": run_start_time.isoformat(),
+        "Protobuf Implementation": api_implementation.Type(),
     }
 
 
@@ -267,11 +294,11 @@ def pytest_report_header(config):
 
 
 def _download_omega_prime_ruleset(tmp_path_factory):
-    uri = OMEGA_PRIME_OSI_370_RULESET_URL
-    filename = pathlib.Path(urlparse(uri).path).name
     base_path = tmp_path_factory.mktemp("osirules")
-    provider = DownloadDataProvider(uri=uri, base_path=base_path)
-    return provider.ensure_data_path(filename)
+    provider = DownloadDataProvider(
+        uri=OMEGA_PRIME_OSI_370_RULESET_URL, base_path=base_path
+    )
+    return provider.ensure_data_path(provider.filename)
 
 
 def pytest_collection_modifyitems(config, items):
@@ -1,5 +1,5 @@
 import logging
-import os
+import shlex
 import subprocess
 from pathlib import Path
 from osi_utilities import (
@@ -27,7 +27,7 @@ class ESMini(OSCTool):
     def __init__(self, tool_path=None):
         super().__init__(self.resolve_tool_path(tool_path, "esmini"))
 
-    def get_version(self) -> list[str]:
+    def _query_version(self) -> list[str]:
         cmd = [str(self.tool_path), "--version"]
         res = subprocess.run(cmd, capture_output=True, text=True, check=False)
         stdout = (res.stdout or "").strip()
@@ -73,7 +73,7 @@ class ESMini(OSCTool):
         )
 
         cmd = [
-            self.tool_path,
+            str(self.tool_path),
             "--headless",
             "--osc",
             str(osc_path),
@@ -82,7 +82,8 @@ class ESMini(OSCTool):
             "--ground_plane",
             "--fixed_timestep",
             str(rate),
-            "--osi_static_reporting 2",  # report static data at every step
+            "--osi_static_reporting",
+            "2",  # report static data at every step
             "--traj_filter",
             "0.0",  # preserve exact trajectory samples for validation
         ]
@@ -90,12 +91,14 @@ class ESMini(OSCTool):
         if log_path is not None:
             cmd.extend(["--logfile_path", str(log_path / "esmini.log")])
 
-        cmd_str = " ".join(map(str, cmd))
+        cmd_str = shlex.join(cmd)
         logging.info(f"Running esmini with command: '{cmd_str}'")
-        os.system(cmd_str)
+        # The argument list is passed to esmini directly instead of through a
+        # shell, so paths need no quoting. Console output is not captured.
+        result = subprocess.run(cmd, check=False)
         if not osi_esmini_gt_spec.exists():
             raise RuntimeError(
-                f"ESMini trace could not be generated. Check the tool's logs for more details."
+                f"ESMini trace could not be generated (exit code: {result.returncode}). Check the tool's logs for more details."
             )
         logging.info(f"Esmini temp output: {osi_esmini_gt_spec}")
 
@@ -112,8 +115,11 @@ class ESMini(OSCTool):
         elif osi_output_spec.message_type == MessageType.GROUND_TRUTH:
             if (
                 osi_output_spec.trace_file_format
-                != osi_esmini_gt_spec.trace_file_format
+                == osi_esmini_gt_spec.trace_file_format
+                and osi_output_spec.path.suffix == osi_esmini_gt_spec.path.suffix
             ):
+                output_spec = rename_to(osi_esmini_gt_spec, osi_output_spec.path)
+            else:
                 with (
                     open_channel(osi_esmini_gt_spec) as channel_reader,
                     open_channel_writer(osi_output_spec) as channel_writer,
@@ -121,8 +127,6 @@ class ESMini(OSCTool):
                     for msg in channel_reader:
                         channel_writer.write_message(msg)
                 output_spec = channel_writer.get_channel_specification()
-            else:
-                output_spec = rename_to(osi_esmini_gt_spec, osi_output_spec.path)
 
         logging.info(f"Output trace specification: {output_spec}")
 
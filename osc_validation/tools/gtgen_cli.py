@@ -1,4 +1,5 @@
 import logging
+import shlex
 import subprocess
 from pathlib import Path
 from osi_utilities import (
@@ -12,6 +13,7 @@ from osi_utilities import (
 from osc_validation.tools.osctool import OSCTool
 from osc_validation.utils.osi_channel_specification import (
     OSIChannelSpecValidator,
+    rename_to,
     with_name_suffix,
 )
 from osc_validation.tools.metadata import OSC_ENGINE_ERRORS_METADATA_KEY
@@ -25,7 +27,7 @@ class GTGen_Simulator(OSCTool):
     def __init__(self, tool_path=None):
         super().__init__(self.resolve_tool_path(tool_path, "gtgen_cli"))
 
-    def get_version(self) -> list[str]:
+    def _query_version(self) -> list[str]:
         cmd = [str(self.tool_path), "--version"]
         res = subprocess.run(cmd, capture_output=True, text=True, check=False)
         stdout = (res.stdout or "").strip()
@@ -85,7 +87,7 @@ class GTGen_Simulator(OSCTool):
         if log_path is not None:
             cmd.extend(["--log-file-dir", str(log_path)])
 
-        cmd_str = " ".join(map(str, cmd))
+        cmd_str = shlex.join(map(str, cmd))
         logging.info(f"Running gtgen_cli with command: '{cmd_str}'")
         result = subprocess.run(
             cmd,
@@ -135,13 +137,19 @@ class GTGen_Simulator(OSCTool):
         logging.info(f"GTGen temp output: {osi_gtgen_sv_spec}")
 
         # Adapt output trace file format according to the requested specification
-        with (
-            open_channel_writer(osi_output_spec) as writer,
-            open_channel(osi_gtgen_sv_spec) as reader,
+        if (
+            osi_output_spec.trace_file_format == osi_gtgen_sv_spec.trace_file_format
+            and osi_output_spec.path.suffix == osi_gtgen_sv_spec.path.suffix
         ):
-            for message in reader:
-                writer.write_message(message)
-            output_spec = writer.get_channel_specification()
+            output_spec = rename_to(osi_gtgen_sv_spec, osi_output_spec.path)
+        else:
+            with (
+                open_channel_writer(osi_output_spec) as writer,
+                open_channel(osi_gtgen_sv_spec) as reader,
+            ):
+                for message in reader:
+                    writer.write_message(message)
+                output_spec = writer.get_channel_specification()
         # GTGen sometimes produces a trace even if it reports osc_engine errors.
         # For that case, we include the error messages as metadata in the output
         # channel specification for better traceability.
@@ -1,6 +1,7 @@
 """Tool wrapper for PMSFIT/osc-simulator."""
 
 import logging
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -16,6 +17,7 @@ from osi_utilities import (
 from osc_validation.tools.osctool import OSCTool
 from osc_validation.utils.osi_channel_specification import (
     OSIChannelSpecValidator,
+    rename_to,
     with_name_suffix,
 )
 
@@ -33,7 +35,7 @@ class OscSimulator(OSCTool):
     def __init__(self, tool_path=None):
         super().__init__(self.resolve_tool_path(tool_path, "osc-simulator"))
 
-    def get_version(self) -> list[str]:
+    def _query_version(self) -> list[str]:
         cmd = [str(self.tool_path), "--version"]
         res = subprocess.run(cmd, capture_output=True, text=True, check=False)
         stdout = (res.stdout or "").strip()
@@ -105,7 +107,7 @@ class OscSimulator(OSCTool):
             "3.7.0"
         ]
 
-        cmd_str = " ".join(map(str, cmd))
+        cmd_str = shlex.join(map(str, cmd))
         logging.info("Running osc-simulator with command: '%s'", cmd_str)
 
         result = subprocess.run(
@@ -142,20 +144,25 @@ class OscSimulator(OSCTool):
 
         logging.info("osc-simulator temp output: %s", expected_output)
 
+        osc_simulator_sv_spec = osi_output_spec.with_path(
+            expected_output
+        ).with_message_type(MessageType.SENSOR_VIEW)
+
         # Convert / copy to the requested output specification
-        with (
-            open_channel_writer(osi_output_spec) as writer,
-            open_channel(
-                ChannelSpecification(
-                    path=expected_output,
-                    message_type=MessageType.SENSOR_VIEW,
-                )
-            ) as reader,
+        if (
+            osi_output_spec.trace_file_format == osc_simulator_sv_spec.trace_file_format
+            and osi_output_spec.path.suffix == osc_simulator_sv_spec.path.suffix
         ):
-            for message in reader:
-                writer.write_message(message)
-
-        output_spec = writer.get_channel_specification()
+            output_spec = rename_to(osc_simulator_sv_spec, osi_output_spec.path)
+        else:
+            with (
+                open_channel_writer(osi_output_spec) as writer,
+                open_channel(osc_simulator_sv_spec) as reader,
+            ):
+                for message in reader:
+                    writer.write_message(message)
+
+            output_spec = writer.get_channel_specification()
         logging.info("Output trace specification: %s", output_spec)
         return output_spec
 
@@ -7,6 +7,7 @@ from osi_utilities import ChannelSpecification
 class OSCTool:
     def __init__(self, tool_path=None):
         self.tool_path = Path(tool_path) if tool_path else None
+        self._version = None
 
     @staticmethod
     def resolve_tool_path(tool_path, default_tool_name: str) -> Path:
@@ -26,6 +27,13 @@ class OSCTool:
         )
 
     def get_version(self) -> list[str]:
+        # The version is reported once per test but only queried from the
+        # tool once per instance, as it spawns a subprocess.
+        if self._version is None:
+            self._version = self._query_version()
+        return list(self._version)
+
+    def _query_version(self) -> list[str]:
         return ["unknown version"]
 
     def run(
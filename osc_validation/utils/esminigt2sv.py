@@ -1,6 +1,6 @@
 """Converts OSI GroundTruth trace file export from esmini into OSI SensorView
-trace. Also adds some fields (version, moving object ids, host vehicle id, etc.)
-that are missing in the esmini export."""
+trace. Also adds some fields (version, sensor id, mounting position, host vehicle
+id) that are missing in the esmini export."""
 
 import argparse
 from pathlib import Path
@@ -13,30 +13,31 @@ from osi_utilities import ChannelSpecification, MessageType, open_channel, open_
 def gt2sv(
     gt_channel_spec: ChannelSpecification, sv_channel_spec: ChannelSpecification
 ) -> ChannelSpecification:
+    # Resolve the interface version once instead of walking the descriptor
+    # options twice per message.
+    current_version = osi_version_pb2.DESCRIPTOR.GetOptions().Extensions[
+        osi_version_pb2.current_interface_version
+    ]
     with (
         open_channel(gt_channel_spec) as gt_reader,
         open_channel_writer(sv_channel_spec) as sv_writer,
     ):
+        write_message = sv_writer.write_message
+        # A single SensorView is reused for all frames: the writer serializes
+        # each message immediately, and every per-frame field is replaced by
+        # CopyFrom, so only the constant fields need to be set once.
+        sv_msg = osi_sensorview_pb2.SensorView()
+        sv_msg.sensor_id.value = 10000
+        sv_msg.mounting_position.position.x = 0
+        sv_msg.mounting_position.position.y = 0
+        sv_msg.mounting_position.position.z = 0
+        sv_msg.version.CopyFrom(current_version)
         for gt_msg in gt_reader:
-            gt_msg.version.CopyFrom(
-                osi_version_pb2.DESCRIPTOR.GetOptions().Extensions[
-                    osi_version_pb2.current_interface_version
-                ]
-            )
-            sv_msg = osi_sensorview_pb2.SensorView()
-            sv_msg.sensor_id.value = 10000
-            sv_msg.mounting_position.position.x = 0
-            sv_msg.mounting_position.position.y = 0
-            sv_msg.mounting_position.position.z = 0
+            gt_msg.version.CopyFrom(current_version)
             sv_msg.timestamp.CopyFrom(gt_msg.timestamp)
-            sv_msg.version.CopyFrom(
-                osi_version_pb2.DESCRIPTOR.GetOptions().Extensions[
-                    osi_version_pb2.current_interface_version
-                ]
-            )
             sv_msg.host_vehicle_id.CopyFrom(gt_msg.host_vehicle_id)
             sv_msg.global_ground_truth.CopyFrom(gt_msg)
-            sv_writer.write_message(sv_msg)
+            write_message(sv_msg)
 
     return sv_writer.get_channel_specification()
 
@@ -2,6 +2,7 @@ from pathlib import Path
 import math
 
 from osi3 import osi_common_pb2
+import numpy as np
 import pandas as pd
 
 from osi_utilities import (
@@ -12,6 +13,9 @@ from osi_utilities import (
 )
 
 
+TRAJECTORY_COLUMNS = ("timestamp", "x", "y", "z", "h", "p", "r")
+
+
 def timestamp_osi_to_float(osi_timestamp: osi_common_pb2.Timestamp) -> float:
     return (osi_timestamp.seconds * 1000000000 + osi_timestamp.nanos) / 1000000000
 
@@ -63,47 +67,54 @@ def find_moving_object(message, object_id: int):
     return None
 
 
-def get_trajectory_by_moving_object_id(
+def _collect_trajectories(
     osi_trace: ChannelSpecification,
-    moving_object_id: str,
+    moving_object_ids: set | None,
     start_time: float = None,
     end_time: float = None,
-) -> pd.DataFrame:
+) -> dict[int, pd.DataFrame]:
     """
-    Extracts trajectory of OSI MovingObject from the input OSI SensorView or GroundTruth trace in the optionally
-    specified interval.
-
-    Additionally preserves following information on the moving object in the data frame attrs metadata:
-    * id
-    * length
-    * width
-    * height
-    * moving object type
-    * vehicle type
-
-    Returns pandas data frame containing timestamp, x, y, z, h, p, r.
+    Extracts the trajectories of the given moving objects (all if None) in one
+    pass over the trace. Only objects present in the interval are returned.
     """
     assert osi_trace.message_type in (
         MessageType.SENSOR_VIEW,
         MessageType.GROUND_TRUTH,
     )
-    trajectory = {"timestamp": [], "x": [], "y": [], "z": [], "h": [], "p": [], "r": []}
-    object_metadata = {}
+    is_sensor_view = osi_trace.message_type == MessageType.SENSOR_VIEW
+    trajectories = {}
+    objects_metadata = {}
     with open_channel(osi_trace) as channel_reader:
         for message in channel_reader:
-            osi_moving_objects = (
-                message.global_ground_truth.moving_object
-                if osi_trace.message_type == MessageType.SENSOR_VIEW
-                else message.moving_object
-            )
             current_timestamp = timestamp_osi_to_float(message.timestamp)
             if start_time is not None and current_timestamp < start_time:
                 continue
             if end_time is not None and current_timestamp > end_time:
-                continue
+                # Messages of an OSI trace are in chronological order, so the
+                # rest of the trace does not need to be read.
+                break
+            osi_moving_objects = (
+                message.global_ground_truth.moving_object
+                if is_sensor_view
+                else message.moving_object
+            )
             for mo in osi_moving_objects:
-                if mo.id.value != moving_object_id:
+                mo_id = mo.id.value
+                if moving_object_ids is not None and mo_id not in moving_object_ids:
                     continue
+                trajectory = trajectories.get(mo_id)
+                if trajectory is None:
+                    trajectory = trajectories[mo_id] = {
+                        column: [] for column in TRAJECTORY_COLUMNS
+                    }
+                    objects_metadata[mo_id] = {
+                        "id": mo_id,
+                        "length": mo.base.dimension.length,
+                        "width": mo.base.dimension.width,
+                        "height": mo.base.dimension.height,
+                        "type": mo.type,
+                        "vehicle_type": mo.vehicle_classification.type,
+                    }
                 trajectory["timestamp"].append(current_timestamp)
                 trajectory["x"].append(mo.base.position.x)
                 trajectory["y"].append(mo.base.position.y)
@@ -111,19 +122,55 @@ def get_trajectory_by_moving_object_id(
                 trajectory["h"].append(mo.base.orientation.yaw)
                 trajectory["p"].append(mo.base.orientation.pitch)
                 trajectory["r"].append(mo.base.orientation.roll)
-                if not object_metadata:
-                    object_metadata = {
-                        "id": moving_object_id,
-                        "length": mo.base.dimension.length,
-                        "width": mo.base.dimension.width,
-                        "height": mo.base.dimension.height,
-                        "type": mo.type,
-                        "vehicle_type": mo.vehicle_classification.type,
-                    }
-    trajectory_df = pd.DataFrame(trajectory)
-    if object_metadata:
-        trajectory_df.attrs.update(object_metadata)
-    return trajectory_df
+    trajectory_dfs = {}
+    for mo_id, trajectory in trajectories.items():
+        trajectory_df = pd.DataFrame(trajectory)
+        trajectory_df.attrs.update(objects_metadata[mo_id])
+        trajectory_dfs[mo_id] = trajectory_df
+    return trajectory_dfs
+
+
+def get_trajectory_by_moving_object_id(
+    osi_trace: ChannelSpecification,
+    moving_object_id: str,
+    start_time: float = None,
+    end_time: float = None,
+) -> pd.DataFrame:
+    """
+    Extracts trajectory of OSI MovingObject from the input OSI SensorView or GroundTruth trace in the optionally
+    specified interval.
+
+    Additionally preserves following information on the moving object in the data frame attrs metadata:
+    * id
+    * length
+    * width
+    * height
+    * moving object type
+    * vehicle type
+
+    Returns pandas data frame containing timestamp, x, y, z, h, p, r.
+    """
+    trajectories = _collect_trajectories(
+        osi_trace, {moving_object_id}, start_time, end_time
+    )
+    if moving_object_id not in trajectories:
+        return pd.DataFrame({column: [] for column in TRAJECTORY_COLUMNS})
+    return trajectories[moving_object_id]
+
+
+def get_all_trajectories(
+    osi_trace: ChannelSpecification,
+    start_time: float = None,
+    end_time: float = None,
+) -> dict[int, pd.DataFrame]:
+    """
+    Extracts the trajectories of all OSI MovingObjects present in the optionally specified interval of the input
+    OSI SensorView or GroundTruth trace, reading the trace only once.
+
+    Returns pandas data frames as by get_trajectory_by_moving_object_id, keyed by moving object id in order of
+    first appearance.
+    """
+    return _collect_trajectories(osi_trace, None, start_time, end_time)
 
 
 def get_closest_trajectory(
@@ -143,28 +190,48 @@ def get_closest_trajectory(
         pd.DataFrame: The trajectory DataFrame of the tool trace that is closest to the reference trajectory.
     """
 
-    tool_moving_object_ids = get_all_moving_object_ids(tool_channel_spec)
-    tool_trajectories = {
-        obj_id: get_trajectory_by_moving_object_id(
-            tool_channel_spec, obj_id, start_time, end_time
-        )
-        for obj_id in tool_moving_object_ids
-    }
-
-    tool_trajectory = None
-    min_distance = None
-    for obj_id, tool_trajectory in tool_trajectories.items():
-        ref_start = ref_trajectory.iloc[0][["x", "y"]].values
-        tool_start = tool_trajectory.iloc[0][["x", "y"]].values
-        dx = ref_start[0] - tool_start[0]
-        dy = ref_start[1] - tool_start[1]
-        distance = math.hypot(dx, dy)
-        if min_distance is None or distance < min_distance:
-            min_distance = distance
-            nearest_tool_trajectory = tool_trajectory
-        tool_trajectory = nearest_tool_trajectory
-
-    return tool_trajectory
+    # All candidates are extracted in a single pass instead of re-reading the
+    # tool trace once per moving object.
+    tool_trajectories = get_all_trajectories(tool_channel_spec, start_time, end_time)
+    return find_closest_trajectory(ref_trajectory, tool_trajectories)
+
+
+def get_trajectory_starts(trajectories: dict[int, pd.DataFrame]) -> np.ndarray:
+    """
+    Returns the starting x/y positions of the given trajectories as (M, 2) array in dict order.
+    """
+    return np.array(
+        [
+            (trajectory["x"].iat[0], trajectory["y"].iat[0])
+            for trajectory in trajectories.values()
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 2)
+
+
+def find_closest_trajectory(
+    ref_trajectory: pd.DataFrame,
+    tool_trajectories: dict[int, pd.DataFrame],
+    tool_starts: np.ndarray = None,
+) -> pd.DataFrame:
+    """
+    Finds the trajectory among the already extracted tool trajectories that is closest to the reference trajectory
+    based on the starting position.
+    Args:
+        ref_trajectory (pd.DataFrame): Reference trajectory DataFrame containing columns ['timestamp', 'x', 'y', 'z', 'h', 'p', 'r'].
+        tool_trajectories (dict[int, pd.DataFrame]): Candidate trajectories, e.g. as returned by get_all_trajectories.
+        tool_starts (np.ndarray, optional): get_trajectory_starts(tool_trajectories), to reuse it across lookups. Defaults to None.
+    Returns:
+        pd.DataFrame: The closest candidate trajectory, or None if there are no candidates.
+    """
+    if not tool_trajectories:
+        return None
+    if tool_starts is None:
+        tool_starts = get_trajectory_starts(tool_trajectories)
+    ref_x, ref_y = ref_trajectory["x"].iat[0], ref_trajectory["y"].iat[0]
+    distances = np.hypot(tool_starts[:, 0] - ref_x, tool_starts[:, 1] - ref_y)
+    # argmin returns the first of equally close candidates, as before
+    return list(tool_trajectories.values())[int(np.argmin(distances))]
 
 
 def rotatePointZYX(x, y, z, yaw, pitch, roll):
@@ -181,12 +248,27 @@ def rotatePointZYX(x, y, z, yaw, pitch, roll):
     Returns:
     * rx,ry,rz          rotated coordinate
     """
-    cos_yaw = math.cos(yaw)
-    cos_pitch = math.cos(pitch)
-    cos_roll = math.cos(roll)
-    sin_yaw = math.sin(yaw)
-    sin_pitch = math.sin(pitch)
-    sin_roll = math.sin(roll)
+    rx, ry, rz = rotatePointsZYX(x, y, z, yaw, pitch, roll)
+    return (float(rx), float(ry), float(rz))
+
+
+def rotatePointsZYX(x, y, z, yaw, pitch, roll):
+    """Vectorized variant of rotatePointZYX for arrays of rotation angles.
+    Holds the z-y-x rotation formula used by both functions.
+
+    Parameters:
+    * x,y,z             input coordinate(s), scalars or arrays
+    * yaw,pitch,roll    arrays of rotation angles
+
+    Returns:
+    * rx,ry,rz          arrays of rotated coordinates
+    """
+    cos_yaw = np.cos(yaw)
+    cos_pitch = np.cos(pitch)
+    cos_roll = np.cos(roll)
+    sin_yaw = np.sin(yaw)
+    sin_pitch = np.sin(pitch)
+    sin_roll = np.sin(roll)
 
     # rotation order z-y-x
     rx = (
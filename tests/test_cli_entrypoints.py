@@ -309,6 +309,31 @@ def test_osi2osc_main_writes_scenario(tmp_path, monkeypatch):
     assert output_path.exists()
 
 
+def test_osi2osc_main_forwards_max_workers(tmp_path, monkeypatch):
+    trace_path = tmp_path / "input.osi"
+    _write_sensorview_trace(trace_path, [0.0, 1.0])
+    calls = []
+
+    monkeypatch.setattr(
+        osi2osc_module, "osi2osc", lambda **kwargs: calls.append(kwargs)
+    )
+    monkeypatch.setattr(
+        osi2osc_module.sys,
+        "argv",
+        [
+            "osi2osc",
+            str(trace_path),
+            "SensorView",
+            str(tmp_path / "scenario.xosc"),
+            "--max-workers",
+            "2",
+        ],
+    )
+
+    assert osi2osc_module.main() == 0
+    assert [call["max_workers"] for call in calls] == [2]
+
+
 def test_osi_format_converter_main_converts_trace_to_mcap(tmp_path, monkeypatch):
     input_path = tmp_path / "input.osi"
     input_spec = ChannelSpecification(path=input_path, message_type="SensorView")
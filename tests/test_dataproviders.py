@@ -13,8 +13,19 @@ from osc_validation.dataproviders.dataprovider import (
 
 
 class _FakeResponse:
-    def __init__(self, content: bytes):
-        self.content = content
+    def __init__(self, content: bytes, headers: dict | None = None, status_code=200):
+        self.raw = io.BytesIO(content)
+        self.headers = headers or {}
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
 
 
 def test_data_provider_raises_for_missing_path(tmp_path):
@@ -56,24 +67,298 @@ def test_download_data_provider_skips_download_when_cached(tmp_path, monkeypatch
     assert provider.ensure_data_path("file.txt") == provider.file_path
 
 
+def test_download_data_provider_streams_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(b"payload"),
+    )
+
+    provider = DownloadDataProvider(
+        uri="https://example.com/file.txt",
+        base_path=tmp_path / "download",
+    )
+
+    downloaded = provider.ensure_data_path("file.txt")
+
+    assert downloaded.read_bytes() == b"payload"
+    assert not (provider.base_path / "file.txt.tmp").exists()
+
+
 def test_download_zip_data_provider_extracts_archive(tmp_path, monkeypatch):
     archive = io.BytesIO()
     with zipfile.ZipFile(archive, "w") as zip_file:
         zip_file.writestr("nested/file.txt", "payload")
+        zip_file.writestr("nested/deeper/other.txt", "other payload")
+        zip_file.writestr("top.txt", "top payload")
 
     monkeypatch.setattr(
-        "osc_validation.dataproviders.dataprovider.requests.get",
-        lambda uri: _FakeResponse(archive.getvalue()),
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(archive.getvalue()),
     )
 
     provider = DownloadZIPDataProvider(
         uri="https://example.com/archive.zip",
         base_path=tmp_path / "zip",
+        force_download=True,
     )
 
     extracted = provider.ensure_data_path("nested/file.txt")
 
     assert extracted.read_text(encoding="utf-8") == "payload"
+    assert (provider.base_path / "nested" / "deeper" / "other.txt").read_text(
+        encoding="utf-8"
+    ) == "other payload"
+    assert (provider.base_path / "top.txt").read_text(encoding="utf-8") == "top payload"
     assert provider.loaded is True
+    assert not provider.file_path.exists()
     provider.cleanup()
     assert not provider.base_path.exists()
+
+
+def test_download_zip_data_provider_without_cache_dir_is_not_loaded(tmp_path):
+    provider = DownloadZIPDataProvider(
+        uri="https://example.com/archive.zip",
+        base_path=tmp_path / "missing",
+        force_download=False,
+    )
+
+    assert provider.loaded is False
+
+
+def test_download_data_provider_keeps_cache_on_cleanup(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(b"payload", {"ETag": '"v1"'}),
+    )
+
+    provider = DownloadDataProvider(
+        uri="https://example.com/file.txt",
+        base_path=tmp_path / "download",
+    )
+    provider.ensure_data_path("file.txt")
+    provider.cleanup()
+
+    assert provider.file_path.read_bytes() == b"payload"
+    assert provider.etag_path.read_text(encoding="utf-8") == '"v1"\n'
+
+
+def test_download_data_provider_redownloads_changed_cache(tmp_path, monkeypatch):
+    base = tmp_path / "download"
+    base.mkdir()
+    (base / "file.txt").write_bytes(b"old")
+    (base / "file.txt.etag").write_text('"v1"\nMon, 01 Jan 2024 00:00:00 GMT')
+    sent_headers = []
+
+    def _get(uri, **kwargs):
+        sent_headers.append(kwargs["headers"])
+        return _FakeResponse(b"new", {"ETag": '"v2"'})
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get", _get
+    )
+
+    provider = DownloadDataProvider(uri="https://example.com/file.txt", base_path=base)
+
+    assert provider.ensure_data_path("file.txt").read_bytes() == b"new"
+    assert provider.etag_path.read_text(encoding="utf-8") == '"v2"\n'
+    assert sent_headers == [
+        {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+    ]
+
+
+def test_download_data_provider_keeps_unmodified_cache(tmp_path, monkeypatch):
+    base = tmp_path / "download"
+    base.mkdir()
+    (base / "file.txt").write_bytes(b"cached")
+    (base / "file.txt.etag").write_text('"v1"\n')
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(b"", status_code=304),
+    )
+
+    provider = DownloadDataProvider(uri="https://example.com/file.txt", base_path=base)
+
+    assert provider.ensure_data_path("file.txt").read_bytes() == b"cached"
+    assert provider.cache_validated is True
+
+
+def test_download_zip_data_provider_rejects_member_outside_base_path(
+    tmp_path, monkeypatch
+):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("../escaped.txt", "payload")
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(archive.getvalue()),
+    )
+
+    provider = DownloadZIPDataProvider(
+        uri="https://example.com/archive.zip",
+        base_path=tmp_path / "zip",
+    )
+
+    with pytest.raises(ValueError, match="outside"):
+        provider.download()
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_download_zip_data_provider_recovers_from_failed_extraction(
+    tmp_path, monkeypatch
+):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("file.txt", "payload")
+    responses = [b"not a zip archive", archive.getvalue()]
+
+    def _get(uri, **kwargs):
+        if "If-None-Match" in kwargs["headers"]:
+            return _FakeResponse(b"", status_code=304)
+        return _FakeResponse(responses.pop(0), {"ETag": '"v1"'})
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get", _get
+    )
+    base = tmp_path / "zip"
+    # Leftover of an earlier, partially extracted download without validators.
+    base.mkdir()
+    (base / "partial.txt").write_text("partial")
+
+    provider = DownloadZIPDataProvider(uri="https://example.com/a.zip", base_path=base)
+    with pytest.raises(zipfile.BadZipFile):
+        provider.ensure_loaded()
+    assert not provider.etag_path.exists()
+
+    provider = DownloadZIPDataProvider(uri="https://example.com/a.zip", base_path=base)
+    assert provider.loaded is True
+    assert provider.ensure_data_path("file.txt").read_text(encoding="utf-8") == (
+        "payload"
+    )
+    assert provider.etag_path.read_text(encoding="utf-8") == '"v1"\n'
+
+
+def test_download_data_provider_downloads_shared_resource_once(tmp_path, monkeypatch):
+    downloads = []
+
+    def _get(uri, **kwargs):
+        downloads.append(uri)
+        return _FakeResponse(b"payload")
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get", _get
+    )
+
+    providers = [
+        DownloadDataProvider(
+            uri="https://example.com/file.txt",
+            base_path=tmp_path / "download",
+            force_download=True,
+        )
+        for _ in range(2)
+    ]
+    for provider in providers:
+        assert provider.ensure_data_path("file.txt").read_bytes() == b"payload"
+
+    assert downloads == ["https://example.com/file.txt"]
+
+    providers[1].cleanup()
+    assert providers[0].file_path.exists()
+    providers[0].cleanup()
+    assert not providers[0].base_path.exists()
+
+
+def test_download_data_provider_truncates_preallocated_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get",
+        lambda uri, **kwargs: _FakeResponse(b"payload", {"Content-Length": "4096"}),
+    )
+
+    provider = DownloadDataProvider(
+        uri="https://example.com/file.txt",
+        base_path=tmp_path / "download",
+    )
+
+    assert provider.ensure_data_path("file.txt").read_bytes() == b"payload"
+
+
+def test_download_data_provider_uses_parallel_range_requests(tmp_path, monkeypatch):
+    payload = bytes(range(256)) * 40
+    requested_ranges = []
+
+    def fake_get(uri, headers=None, **kwargs):
+        if not headers or "Range" not in headers:
+            return _FakeResponse(
+                b"",
+                {
+                    "Accept-Ranges": "bytes",
+                    "Content-Length": str(len(payload)),
+                    "ETag": '"v1"',
+                },
+            )
+        assert headers["If-Range"] == '"v1"'
+        lo, hi = map(int, headers["Range"].removeprefix("bytes=").split("-"))
+        requested_ranges.append((lo, hi))
+        return _FakeResponse(payload[lo : hi + 1], status_code=206)
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._PARALLEL_DOWNLOAD_MIN_SIZE", 1
+    )
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get", fake_get
+    )
+
+    provider = DownloadDataProvider(
+        uri="https://example.com/file.txt",
+        base_path=tmp_path / "download",
+    )
+
+    assert provider.ensure_data_path("file.txt").read_bytes() == payload
+    assert sorted(requested_ranges) == [
+        (0, 2559),
+        (2560, 5119),
+        (5120, 7679),
+        (7680, 10239),
+    ]
+
+
+def test_download_data_provider_falls_back_if_ranges_are_ignored(tmp_path, monkeypatch):
+    payload = bytes(range(256)) * 40
+    range_headers = []
+
+    def fake_get(uri, headers=None, **kwargs):
+        if headers and "Range" in headers:
+            range_headers.append(headers)
+        # The server advertises range support but always sends the full body.
+        return _FakeResponse(
+            payload,
+            {
+                "Accept-Ranges": "bytes",
+                "Content-Length": str(len(payload)),
+                "ETag": 'W/"v1"',
+                "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._PARALLEL_DOWNLOAD_MIN_SIZE", 1
+    )
+    monkeypatch.setattr(
+        "osc_validation.dataproviders.dataprovider._HTTP_SESSION.get", fake_get
+    )
+
+    provider = DownloadDataProvider(
+        uri="https://example.com/file.txt",
+        base_path=tmp_path / "download",
+    )
+
+    assert provider.ensure_data_path("file.txt").read_bytes() == payload
+    assert range_headers
+    # Weak ETags must not be used as If-Range validator.
+    assert {headers["If-Range"] for headers in range_headers} == {
+        "Mon, 01 Jan 2024 00:00:00 GMT"
+    }
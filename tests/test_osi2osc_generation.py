@@ -10,6 +10,7 @@ from osc_validation.generation.osi2osc import (
     osi2osc,
     parse_moving_objects,
 )
+from osc_validation.generation.xosc_builders import write_xosc_tree
 from tests.conftest import _make_ground_truth, _make_sensor_view
 
 
@@ -181,6 +182,56 @@ def test_osi2osc_without_matching_host_vehicle_keeps_generic_names(tmp_path):
     ]
 
 
+def _write_sensor_view_trace(trace_path: Path) -> ChannelSpecification:
+    spec = ChannelSpecification(path=trace_path, message_type="SensorView")
+    with open_channel_writer(spec) as writer:
+        for frame in range(3):
+            writer.write_message(
+                _make_sensor_view_frame(
+                    0.1 * frame,
+                    host_vehicle_id=2,
+                    ego_x=10.0 + frame,
+                    other_x=float(frame),
+                )
+            )
+    return spec
+
+
+def test_osi2osc_streamed_document_matches_pretty_printed_tree(tmp_path):
+    result = osi2osc(
+        _write_sensor_view_trace(tmp_path / "input_trace.osi"),
+        tmp_path / "scenario.xosc",
+    )
+
+    # Rewrite the document the way osi2osc wrote it before streaming the Story
+    tree = etree.parse(str(result), etree.XMLParser(remove_blank_text=True))
+    expected_path = tmp_path / "expected.xosc"
+    write_xosc_tree(expected_path, tree.getroot())
+
+    assert etree.canonicalize(from_file=str(result)) == etree.canonicalize(
+        from_file=str(expected_path)
+    )
+
+
+def test_osi2osc_builds_identical_acts_in_process_pool(tmp_path):
+    trace_spec = _write_sensor_view_trace(tmp_path / "input_trace.osi")
+
+    documents = []
+    for max_workers in (1, 2):
+        result = osi2osc(
+            trace_spec,
+            tmp_path / f"scenario_{max_workers}.xosc",
+            max_workers=max_workers,
+        )
+        tree = etree.parse(str(result))
+        # The generation time may differ between both runs
+        tree.find("FileHeader").attrib.pop("date")
+        documents.append(etree.tostring(tree))
+
+    assert len(etree.fromstring(documents[0]).findall(".//Story/Act")) == 2
+    assert documents[1] == documents[0]
+
+
 def test_osi2osc_rejects_empty_trace(tmp_path):
     trace_path = tmp_path / "empty.osi"
     with open_channel_writer(
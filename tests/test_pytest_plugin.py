@@ -160,3 +160,23 @@ def create_tool(toolpath):
             )
     finally:
         wrapper.unlink(missing_ok=True)
+
+
+@pytest.mark.parametrize(
+    ("numprocesses", "dist", "expected"),
+    [
+        (2, "no", "loadfile"),
+        (2, "loadscope", "loadscope"),
+        (None, "no", "no"),
+    ],
+)
+def test_use_loadfile_distribution_by_default(numprocesses, dist, expected):
+    config = types.SimpleNamespace(
+        option=types.SimpleNamespace(
+            numprocesses=numprocesses, dist=dist, distload=False
+        )
+    )
+
+    plugin.use_loadfile_distribution_by_default(config)
+
+    assert config.option.dist == expected
@@ -1,10 +1,15 @@
 from pathlib import Path
 
+import numpy as np
 import pytest
+import similaritymeasures
 
 from osi_utilities import ChannelSpecification, open_channel_writer
 
-from osc_validation.metrics.trajectory_similarity import TrajectorySimilarityMetric
+from osc_validation.metrics.trajectory_similarity import (
+    TrajectorySimilarityMetric,
+    area_between_two_curves,
+)
 from tests.conftest import _make_sensor_view
 
 
@@ -118,3 +123,59 @@ def test_trajectory_similarity_metric_rejects_length_mismatch(tmp_path):
             tool_channel_spec=tool_spec,
             moving_object_id=1,
         )
+
+
+def test_area_between_two_curves_matches_similaritymeasures():
+    rng = np.random.default_rng(0)
+    reference_xy = rng.random((50, 2))
+    tool_xy = rng.random((50, 2))
+
+    assert area_between_two_curves(reference_xy, tool_xy) == pytest.approx(
+        similaritymeasures.area_between_two_curves(reference_xy, tool_xy)
+    )
+
+
+def test_trajectory_similarity_metric_compute_all_matches_nearest_objects(tmp_path):
+    reference_spec = _write_sensorview_trace(
+        tmp_path / "reference.osi",
+        {1: [0.0, 1.0, 2.0], 2: [100.0, 101.0, 102.0]},
+    )
+    tool_spec = _write_sensorview_trace(
+        tmp_path / "tool.osi",
+        {3: [100.0, 101.0, 102.5], 4: [0.0, 1.0, 2.0]},
+    )
+
+    metric = TrajectorySimilarityMetric()
+    results = metric.compute_all(
+        reference_channel_spec=reference_spec,
+        tool_channel_spec=tool_spec,
+    )
+
+    assert list(results) == [1, 2]
+    assert results[1][2] == pytest.approx(1.5)
+    assert results[2][2] == pytest.approx(3.5 / 6)
+
+
+def test_trajectory_similarity_metric_writes_summary_only_report(tmp_path):
+    reference_spec = _write_sensorview_trace(
+        tmp_path / "reference.osi",
+        {1: [0.0, 1.0, 2.0]},
+    )
+    tool_spec = _write_sensorview_trace(
+        tmp_path / "tool.osi",
+        {1: [0.0, 1.0, 2.0]},
+    )
+    result_file = tmp_path / "similarity.txt"
+
+    metric = TrajectorySimilarityMetric()
+    metric.compute(
+        reference_channel_spec=reference_spec,
+        tool_channel_spec=tool_spec,
+        moving_object_id=1,
+        result_file=result_file,
+        verbose_report=False,
+    )
+
+    report = result_file.read_text(encoding="utf-8")
+    assert "Similarity Measures" in report
+    assert "Reference trajectory" not in report
@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pytest
 
 from osi_utilities import ChannelSpecification, open_channel, open_channel_writer
@@ -9,8 +10,10 @@ from osi_utilities import ChannelSpecification, open_channel, open_channel_write
 from osc_validation.utils.utils import (
     crop_trace,
     get_all_moving_object_ids,
+    get_all_trajectories,
     get_trajectory_by_moving_object_id,
     rotatePointZYX,
+    rotatePointsZYX,
 )
 from tests.conftest import _make_sensor_view
 
@@ -77,6 +80,32 @@ def test_get_trajectory_with_interval(tmp_path):
     assert len(trajectory) == 4
 
 
+def test_get_all_trajectories_in_interval(tmp_path):
+    messages = []
+    for index in range(5):
+        sensor_view = _make_sensor_view(index * 0.1, obj_id=1)
+        if index >= 2:
+            moving_object = sensor_view.global_ground_truth.moving_object.add()
+            moving_object.id.value = 2
+            moving_object.base.position.x = 100.0
+        messages.append(sensor_view)
+    path = tmp_path / "multi_traj.osi"
+    with open_channel_writer(
+        ChannelSpecification(path=path, message_type="SensorView")
+    ) as writer:
+        for msg in messages:
+            writer.write_message(msg)
+    spec = ChannelSpecification(path=path, message_type="SensorView")
+
+    trajectories = get_all_trajectories(spec, start_time=0.1)
+
+    assert list(trajectories) == [1, 2]
+    assert len(trajectories[1]) == 4
+    assert len(trajectories[2]) == 3
+    assert trajectories[2].attrs.get("id") == 2
+    assert list(get_all_trajectories(spec, end_time=0.15)) == [1]
+
+
 def test_crop_trace(tmp_path, sample_sensor_views):
     in_path = tmp_path / "full.osi"
     with open_channel_writer(
@@ -136,3 +165,24 @@ def test_rotate_point_zyx_90_yaw():
     assert rx == pytest.approx(0.0, abs=1e-10)
     assert ry == pytest.approx(1.0, abs=1e-10)
     assert rz == pytest.approx(0.0, abs=1e-10)
+
+
+def test_rotate_points_zyx_matches_rotation_matrices():
+    yaw = np.array([0.0, 0.25, math.pi / 2])
+    pitch = np.array([0.0, 0.1, -0.3])
+    roll = np.array([0.0, -0.05, 0.2])
+
+    rx, ry, rz = rotatePointsZYX(1.8, 0.2, 0.6, yaw, pitch, roll)
+
+    for index in range(len(yaw)):
+        cy, sy = math.cos(yaw[index]), math.sin(yaw[index])
+        cp, sp = math.cos(pitch[index]), math.sin(pitch[index])
+        cr, sr = math.cos(roll[index]), math.sin(roll[index])
+        rot_z = np.array([[cy, -sy, 0.0], [sy, cy, 0.0], [0.0, 0.0, 1.0]])
+        rot_y = np.array([[cp, 0.0, sp], [0.0, 1.0, 0.0], [-sp, 0.0, cp]])
+        rot_x = np.array([[1.0, 0.0, 0.0], [0.0, cr, -sr], [0.0, sr, cr]])
+        expected = rot_z @ rot_y @ rot_x @ np.array([1.8, 0.2, 0.6])
+        assert (rx[index], ry[index], rz[index]) == pytest.approx(expected)
+        assert rotatePointZYX(
+            1.8, 0.2, 0.6, yaw[index], pitch[index], roll[index]
+        ) == pytest.approx(expected)